@@ -0,0 +1,32 @@
+"""add keyset pagination indexes
+
+Revision ID: a83c5d10f2e7
+Revises: e41f7a2c9b35
+Create Date: 2026-10-18 11:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a83c5d10f2e7'
+down_revision: Union[str, Sequence[str], None] = 'e41f7a2c9b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_items_name_id', 'items', ['name', 'id'], unique=False)
+    op.create_index('ix_clients_created_at_id', 'clients', ['created_at', 'id'], unique=False)
+    op.create_index('ix_mcp_servers_name_id', 'mcp_servers', ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_mcp_servers_name_id', table_name='mcp_servers')
+    op.drop_index('ix_clients_created_at_id', table_name='clients')
+    op.drop_index('ix_items_name_id', table_name='items')
@@ -0,0 +1,43 @@
+"""add item search indexes
+
+Revision ID: b5e92d4f7c18
+Revises: a83c5d10f2e7
+Create Date: 2026-10-18 12:41:09.218374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e92d4f7c18'
+down_revision: Union[str, Sequence[str], None] = 'a83c5d10f2e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must stay identical to app.models.item.ITEM_SEARCH_DOCUMENT.
+SEARCH_DOCUMENT = "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_items_name_trgm', 'items', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_items_description_trgm', 'items', ['description'], unique=False,
+        postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+    op.create_index('ix_items_search_tsv', 'items', [sa.text(SEARCH_DOCUMENT)], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_items_search_tsv', table_name='items')
+    op.drop_index('ix_items_description_trgm', table_name='items')
+    op.drop_index('ix_items_name_trgm', table_name='items')
+    # pg_trgm is left installed; other objects may depend on it.
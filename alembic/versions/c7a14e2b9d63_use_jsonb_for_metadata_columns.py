@@ -0,0 +1,51 @@
+"""use jsonb for metadata columns
+
+Revision ID: c7a14e2b9d63
+Revises: b5e92d4f7c18
+Create Date: 2026-10-18 13:27:45.603118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a14e2b9d63'
+down_revision: Union[str, Sequence[str], None] = 'b5e92d4f7c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'items', 'item_metadata',
+        existing_type=sa.JSON(), type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='item_metadata::jsonb',
+    )
+    op.alter_column(
+        'mcp_servers', 'metadata',
+        existing_type=sa.JSON(), type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=True, postgresql_using='metadata::jsonb',
+    )
+    op.create_index('ix_items_item_metadata_gin', 'items', ['item_metadata'], unique=False, postgresql_using='gin')
+    op.create_index('ix_mcp_servers_metadata_gin', 'mcp_servers', ['metadata'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_mcp_servers_metadata_gin', table_name='mcp_servers')
+    op.drop_index('ix_items_item_metadata_gin', table_name='items')
+    op.alter_column(
+        'mcp_servers', 'metadata',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()), type_=sa.JSON(),
+        existing_nullable=True, postgresql_using='metadata::json',
+    )
+    op.alter_column(
+        'items', 'item_metadata',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()), type_=sa.JSON(),
+        postgresql_using='item_metadata::json',
+    )
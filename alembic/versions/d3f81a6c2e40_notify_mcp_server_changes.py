@@ -0,0 +1,44 @@
+"""notify mcp server changes
+
+Revision ID: d3f81a6c2e40
+Revises: c7a14e2b9d63
+Create Date: 2026-10-18 16:05:12.418730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f81a6c2e40'
+down_revision: Union[str, Sequence[str], None] = 'c7a14e2b9d63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The payload is the server id; listeners reload the row themselves.
+    op.execute("""
+        CREATE FUNCTION notify_mcp_servers_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('mcp_servers_changed', COALESCE(NEW.id, OLD.id)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Only configuration columns: health checks (status, last_health_check) don't notify.
+    op.execute("""
+        CREATE TRIGGER mcp_servers_changed
+        AFTER INSERT OR DELETE OR UPDATE OF
+            name, server_url, api_key, transport_type, is_enabled, is_deleted, metadata
+        ON mcp_servers
+        FOR EACH ROW EXECUTE FUNCTION notify_mcp_servers_changed()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS mcp_servers_changed ON mcp_servers")
+    op.execute("DROP FUNCTION IF EXISTS notify_mcp_servers_changed()")
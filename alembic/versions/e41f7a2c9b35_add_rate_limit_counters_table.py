@@ -0,0 +1,34 @@
+"""add rate_limit_counters table
+
+Revision ID: e41f7a2c9b35
+Revises: 794366c73a53
+Create Date: 2026-10-18 09:12:40.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41f7a2c9b35'
+down_revision: Union[str, Sequence[str], None] = '794366c73a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rate_limit_counters',
+    sa.Column('bucket_key', sa.String(), nullable=False),
+    sa.Column('window_start', sa.BigInteger(), nullable=False),
+    sa.Column('used', sa.Integer(), nullable=False),
+    sa.Column('last_grant', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_key', 'window_start')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('rate_limit_counters')
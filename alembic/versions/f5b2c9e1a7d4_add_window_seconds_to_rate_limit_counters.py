@@ -0,0 +1,30 @@
+"""add window_seconds to rate_limit_counters
+
+Revision ID: f5b2c9e1a7d4
+Revises: d3f81a6c2e40
+Create Date: 2026-10-18 18:42:07.513962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b2c9e1a7d4'
+down_revision: Union[str, Sequence[str], None] = 'd3f81a6c2e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The length of existing rows' windows is unknown; treat them as a day, as the old prune did.
+    op.add_column('rate_limit_counters', sa.Column('window_seconds', sa.Integer(), nullable=False, server_default='86400'))
+    op.alter_column('rate_limit_counters', 'window_seconds', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('rate_limit_counters', 'window_seconds')
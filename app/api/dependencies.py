@@ -1,16 +1,22 @@
 # app/api/dependencies.py
 
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, Query, status, Header
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
-from typing import Optional
+import math
+from typing import List, Optional
 
 from app.core.config import settings
 from app.schemas.user import TokenData
+from app.schemas.client import ClientIdentity
 from app.services.user_services import UserService
 from app.services.client_services import ClientService
-from app.db.session import get_db
+from app.services.client_auth_cache import client_auth_cache
+from app.services.client_activity import last_access_recorder
+from app.services.rate_limiter import rate_limiter
+from app.db.session import SessionLocal, get_db
+from app.db.metadata_filter import InvalidMetadataFilterError, MetadataFilter, parse_metadata_filter
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/token")
 
@@ -38,13 +44,15 @@ async def get_current_user(db: AsyncSession = Depends(get_db), token: str = Depe
 
 
 async def get_current_client(
-    db: AsyncSession = Depends(get_db),
     x_client_id: Optional[str] = Header(None, description="Client ID"),
     x_api_key: Optional[str] = Header(None, description="Client API Key")
 ):
     """
     Dependency for client authentication (Layer 1)
-    Clients authenticate using X-Client-ID and X-API-Key headers
+    Clients authenticate using X-Client-ID and X-API-Key headers.
+    Verified credentials are cached briefly so the common case needs no DB round-trip.
+    On a miss the lookup uses its own session, closed before the route runs, so
+    routes that don't touch the database (the MCP gateway) never hold a connection.
     """
     if not x_client_id or not x_api_key:
         raise HTTPException(
@@ -53,7 +61,14 @@ async def get_current_client(
             headers={"WWW-Authenticate": "ApiKey"},
         )
     
-    client = await ClientService.authenticate_client(db, x_client_id, x_api_key)
+    identity = client_auth_cache.get(x_client_id, x_api_key)
+    if identity is not None:
+        last_access_recorder.touch(identity.id)
+        return identity
+
+    cache_version = client_auth_cache.version(x_client_id)
+    async with SessionLocal() as db:
+        client = await ClientService.authenticate_client(db, x_client_id, x_api_key)
     
     if not client:
         raise HTTPException(
@@ -62,6 +77,36 @@ async def get_current_client(
             headers={"WWW-Authenticate": "ApiKey"},
         )
     
+    identity = ClientIdentity.model_validate(client)
+    client_auth_cache.put(x_client_id, x_api_key, identity, cache_version)
+    last_access_recorder.touch(identity.id)
+    return identity
+
+
+async def enforce_rate_limit(client: ClientIdentity, cost: int = 1) -> None:
+    """
+    Charge `cost` requests against the client's rate_limit ("count/period").
+    Raises 429 with a Retry-After header if they don't fit.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+
+    allowed, retry_after = await rate_limiter.acquire(client.id, client.rate_limit, cost)
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded ({client.rate_limit or settings.DEFAULT_RATE_LIMIT})",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+async def get_rate_limited_client(client: ClientIdentity = Depends(get_current_client)):
+    """
+    Dependency enforcing the client's rate_limit on top of Layer 1 auth, one request per call.
+    Routes whose request makes several upstream calls use get_current_client and
+    enforce_rate_limit with the number of calls instead.
+    """
+    await enforce_rate_limit(client)
     return client
 
 
@@ -78,3 +123,14 @@ async def verify_mcp_server_access(
     # You can add more logic here to check if client has access to specific server
     return client
 
+
+def get_metadata_filter(
+    metadata: Optional[str] = Query(None, description='JSON object the metadata must contain, e.g. {"env": "prod"}'),
+    meta: Optional[List[str]] = Query(None, description="key=value predicate; dotted keys reach nested objects"),
+    has_key: Optional[List[str]] = Query(None, description="Key the metadata must have"),
+) -> Optional[MetadataFilter]:
+    """Dependency parsing the metadata filter query parameters of list endpoints."""
+    try:
+        return parse_metadata_filter(metadata, meta, has_key)
+    except InvalidMetadataFilterError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
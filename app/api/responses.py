@@ -0,0 +1,22 @@
+# app/api/responses.py
+
+from typing import Any, Dict, Optional
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+def json_bytes_response(
+    content: bytes, headers: Optional[Dict[str, str]] = None, status_code: int = 200
+) -> Response:
+    """
+    Response for a body that is already JSON. Returning a Response skips the
+    route's response_model validation and encoding, which only repeat work for
+    data serialized straight from validated models.
+    """
+    return Response(content=content, status_code=status_code, headers=headers, media_type="application/json")
+
+
+def dump_models(adapter: TypeAdapter, objects: Any) -> bytes:
+    """Validate ORM objects with `adapter` once and serialize them to JSON in pydantic-core."""
+    return adapter.dump_json(adapter.validate_python(objects, from_attributes=True))
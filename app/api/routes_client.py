@@ -1,11 +1,12 @@
 # app/api/routes_client.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.db.session import get_db
+from app.db.pagination import InvalidCursorError
 from app.schemas.client import (
     ClientCreate,
     ClientUpdate,
@@ -36,18 +37,25 @@ async def create_client(
 
 @router.get("/", response_model=List[ClientResponse])
 async def list_clients(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     include_inactive: bool = False,
     db: AsyncSession = Depends(get_db),
     # current_user = Depends(get_current_user)  # Uncomment to require admin auth
 ):
     """
-    List all registered clients with pagination.
+    List all registered clients with cursor pagination.
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the next page.
     """
-    clients = await ClientService.get_all_clients(
-        db, skip=skip, limit=limit, include_inactive=include_inactive
-    )
+    try:
+        clients, next_cursor = await ClientService.get_all_clients(
+            db, limit=limit, include_inactive=include_inactive, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return clients
 
 
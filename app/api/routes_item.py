@@ -1,29 +1,227 @@
 # app/api/routes_item.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 from uuid import UUID
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.repositories.item import ItemRepository
-from app.schemas.item import ItemCreate, ItemRead, ItemUpdate
+from app.api.dependencies import get_current_user, get_metadata_filter  # Admin authentication
+from app.api.responses import dump_models, json_bytes_response
+from app.core.config import settings
+from app.db.session import SessionLocal, get_db
+from app.db.metadata_filter import MetadataFilter
+from app.db.pagination import InvalidCursorError
+from app.repositories.item import ItemRepository, project_rows, resolve_item_fields
+from app.models.item import ItemType
+from app.schemas.item import BulkItemResponse, ItemCreate, ItemIngestReport, ItemRead, ItemUpdate
+from app.services.item_ingestion import ItemIngestionService
 
 router = APIRouter(prefix="/items", tags=["items"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+ITEM_ADAPTER = TypeAdapter(ItemRead)
+ITEM_LIST_ADAPTER = TypeAdapter(List[ItemRead])
+
+
+def get_item_fields(
+    view: Literal["full", "lite"] = Query("full", description="lite: only id, name and item_type"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return; overrides view"),
+) -> Optional[List[str]]:
+    try:
+        return resolve_item_fields(view, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _cursor_headers(next_cursor: Optional[str]) -> Optional[Dict[str, str]]:
+    return {"X-Next-Cursor": next_cursor} if next_cursor else None
+
+
+def _items_response(items, fields: Optional[List[str]], next_cursor: Optional[str]) -> Response:
+    if fields:
+        # Projected rows are plain column values: serialize them directly, skipping ItemRead.
+        body = orjson.dumps(project_rows(items, fields))
+    else:
+        body = dump_models(ITEM_LIST_ADAPTER, items)
+    return json_bytes_response(body, headers=_cursor_headers(next_cursor))
+
+
+async def _stream_items_ndjson(
+    metadata_filter: Optional[MetadataFilter] = None, fields: Optional[List[str]] = None
+) -> AsyncIterator[bytes]:
+    # The response outlives the request's dependencies, so the stream owns its session.
+    async with SessionLocal() as session:
+        repo = ItemRepository(session)
+        async for rows in repo.stream_rows(
+            chunk_size=settings.ITEM_STREAM_CHUNK_SIZE, metadata_filter=metadata_filter, fields=fields
+        ):
+            if fields:
+                yield b"".join(orjson.dumps(row) + b"\n" for row in project_rows(rows, fields))
+            else:
+                items = ITEM_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+                yield b"".join(ITEM_ADAPTER.dump_json(item) + b"\n" for item in items)
+
+
+def _check_bulk_size(rows: List[Any]) -> None:
+    if len(rows) > settings.BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BULK_MAX_ROWS} rows per bulk request",
+        )
+
 
 @router.post("/", response_model=ItemRead, status_code=status.HTTP_201_CREATED)
 async def create_item(payload: ItemCreate, db: AsyncSession = Depends(get_db)):
     repo = ItemRepository(db)
     item = await repo.create(payload)
-    return ItemRead.model_validate(item)
+    return json_bytes_response(dump_models(ITEM_ADAPTER, item), status_code=status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/",
+    response_model=List[ItemRead],
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def list_items(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    metadata_filter: Optional[MetadataFilter] = Depends(get_metadata_filter),
+    fields: Optional[List[str]] = Depends(get_item_fields),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List items ordered by name. Pass the X-Next-Cursor response header back as
+    `cursor` to fetch the next page; the header is absent on the last page.
+
+    With `Accept: application/x-ndjson` the whole table is streamed instead,
+    one JSON object per line, with constant memory (`limit`/`cursor` are ignored).
 
+    `metadata`, `meta` and `has_key` filter on item_metadata in the database.
+    `view=lite` or `fields=` return only the chosen columns, read without ORM objects.
+    """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(_stream_items_ndjson(metadata_filter, fields), media_type=NDJSON_MEDIA_TYPE)
 
-@router.get("/", response_model=List[ItemRead])
-async def list_items(db: AsyncSession = Depends(get_db)):
     repo = ItemRepository(db)
-    items = await repo.get_all()
-    return [ItemRead.model_validate(item) for item in items]
+    try:
+        items, next_cursor = await repo.get_page(
+            limit=limit, cursor=cursor, metadata_filter=metadata_filter, fields=fields
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _items_response(items, fields, next_cursor)
+
+
+# Static paths must be registered before "/{item_id}" so they aren't parsed as an id.
+@router.get("/search", response_model=List[ItemRead])
+async def search_items(
+    q: Optional[str] = Query(None, description="Search text"),
+    mode: Literal["substring", "fulltext"] = "substring",
+    name: Optional[str] = None,
+    item_type: Optional[ItemType] = None,
+    min_quantity: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    metadata_filter: Optional[MetadataFilter] = Depends(get_metadata_filter),
+    fields: Optional[List[str]] = Depends(get_item_fields),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Search items by substring (name/description) or ranked full-text query.
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the next page.
+    `view=lite` or `fields=` return only the chosen columns.
+    """
+    repo = ItemRepository(db)
+    try:
+        items, next_cursor = await repo.search(
+            query=q, mode=mode, name=name, item_type=item_type,
+            min_quantity=min_quantity, metadata_filter=metadata_filter,
+            limit=limit, cursor=cursor, fields=fields,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _items_response(items, fields, next_cursor)
+
+
+@router.post("/bulk", response_model=BulkItemResponse)
+async def bulk_create_items(
+    rows: List[Dict[str, Any]] = Body(...),
+    chunk_size: Optional[int] = Query(None, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create many items in a single transaction. Each row is validated as ItemCreate;
+    the response reports the outcome (id or error) of every row by index.
+    """
+    _check_bulk_size(rows)
+    repo = ItemRepository(db)
+    return await repo.bulk_create(rows, chunk_size=chunk_size or settings.BULK_CHUNK_SIZE)
+
+
+@router.patch("/bulk", response_model=BulkItemResponse)
+async def bulk_update_items(
+    rows: List[Dict[str, Any]] = Body(...),
+    chunk_size: Optional[int] = Query(None, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Update many items in a single transaction. Each row needs `id` plus the fields to change.
+    """
+    _check_bulk_size(rows)
+    repo = ItemRepository(db)
+    return await repo.bulk_update(rows, chunk_size=chunk_size or settings.BULK_CHUNK_SIZE)
+
+
+@router.delete("/bulk", response_model=BulkItemResponse)
+async def bulk_delete_items(
+    item_ids: List[str] = Body(...),
+    chunk_size: Optional[int] = Query(None, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Delete many items by id in a single transaction.
+    """
+    _check_bulk_size(item_ids)
+    repo = ItemRepository(db)
+    return await repo.bulk_delete(item_ids, chunk_size=chunk_size or settings.BULK_CHUNK_SIZE)
+
+
+@router.post(
+    "/ingest",
+    response_model=ItemIngestReport,
+    openapi_extra={"requestBody": {"content": {CSV_MEDIA_TYPE: {}, NDJSON_MEDIA_TYPE: {}}}},
+)
+async def ingest_items(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = Query(None, description="Defaults to the Content-Type"),
+    batch_size: Optional[int] = Query(None, ge=1, le=100000),
+    current_user = Depends(get_current_user),
+):
+    """
+    Bulk-load items from a CSV (with header row) or NDJSON request body.
+
+    The body is streamed, validated and COPYed into a staging table, then merged
+    into items in one transaction; rows with an `id` replace the existing item.
+    Returns counts, throughput and the rejected rows.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        if CSV_MEDIA_TYPE in content_type:
+            format = "csv"
+        elif NDJSON_MEDIA_TYPE in content_type:
+            format = "ndjson"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Send {CSV_MEDIA_TYPE} or {NDJSON_MEDIA_TYPE}, or pass ?format=",
+            )
+    return await ItemIngestionService.ingest(request.stream(), format, batch_size=batch_size)
 
 
 @router.get("/{item_id}", response_model=ItemRead)
@@ -32,7 +230,7 @@ async def get_item(item_id: UUID, db: AsyncSession = Depends(get_db)):
     item = await repo.get_by_id(item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
-    return ItemRead.model_validate(item)
+    return json_bytes_response(dump_models(ITEM_ADAPTER, item))
 
 
 @router.put("/{item_id}", response_model=ItemRead)
@@ -42,7 +240,7 @@ async def update_item(item_id: UUID, payload: ItemUpdate, db: AsyncSession = Dep
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     updated = await repo.update(item, payload)
-    return ItemRead.model_validate(updated)
+    return json_bytes_response(dump_models(ITEM_ADAPTER, updated))
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,77 +1,153 @@
 # app/api/routes_mcp_client.py
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException
 from uuid import UUID
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from app.db.session import get_db
+from app.api.responses import json_bytes_response
+from app.schemas.mcp_client import (
+    BatchExecuteRequest,
+    BatchExecuteResponse,
+    CrossServerBatchExecuteRequest,
+    ToolDiscoveryResponse,
+)
 from app.services.mcp_client_services import MCPClientService
-from app.api.dependencies import get_current_client
+from app.services.mcp_result_cache import CachePolicy
+from app.api.dependencies import enforce_rate_limit, get_current_client, get_rate_limited_client
 
 router = APIRouter()
 
+@router.get("/tools", response_model=ToolDiscoveryResponse)
+async def discover_all_tools(
+    refresh: bool = False,
+    client = Depends(get_rate_limited_client)  # Layer 1: Client authentication + rate limit
+):
+    """
+    Get the combined tool catalog of all enabled MCP servers.
+
+    Servers are queried concurrently, each with its own deadline; a slow or
+    unreachable server is reported with status "timeout"/"error" instead of
+    failing the request. Pass `refresh=true` to bypass the catalog cache.
+
+    **Authentication Required**:
+    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers), rate limited per client
+    - Layer 2: MCP Server authentication (handled internally)
+    """
+    return json_bytes_response(orjson.dumps(await MCPClientService.discover_all_tools(refresh=refresh)))
+
+@router.post("/tools/batch-execute", response_model=BatchExecuteResponse)
+async def batch_execute_tools(
+    batch: CrossServerBatchExecuteRequest,
+    client = Depends(get_current_client)  # Layer 1: Client authentication
+):
+    """
+    Execute independent tool calls across several MCP servers in one request.
+
+    Calls run concurrently, one pooled session per server, with at most
+    `parallelism` in flight. Results are returned in request order with their
+    latency; a failed call (including one to an unknown or disabled server)
+    is reported in its own entry.
+
+    **Authentication Required**:
+    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers); each call counts against the rate limit
+    - Layer 2: MCP Server authentication (handled internally via each server's api_key)
+    """
+    await enforce_rate_limit(client, len(batch.calls))
+    calls = [(call.server_id, call.tool_name, call.parameters) for call in batch.calls]
+    result = await MCPClientService.batch_execute_across_servers(calls, batch.parallelism)
+    return json_bytes_response(orjson.dumps(result))
+
 @router.get("/{server_id}/tools", response_model=List[Dict[str, Any]])
 async def list_server_tools(
     server_id: UUID, 
-    db: AsyncSession = Depends(get_db),
-    client = Depends(get_current_client)  # Layer 1: Client authentication
+    refresh: bool = False,
+    client = Depends(get_rate_limited_client)  # Layer 1: Client authentication + rate limit
 ):
     """
     Get the list of available tools from a specific MCP server.
+    The catalog is cached per server; pass `refresh=true` to bypass the cache.
     
     **Authentication Required**: 
-    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers)
+    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers), rate limited per client
     - Layer 2: MCP Server authentication (handled internally)
     """
-    return await MCPClientService.list_tools(db, server_id)
+    return json_bytes_response(await MCPClientService.list_tools_json(server_id, refresh=refresh))
 
 @router.get("/{server_id}/tools/{tool_name}", response_model=Dict[str, Any])
 async def get_server_tool(
     server_id: UUID, 
     tool_name: str, 
-    db: AsyncSession = Depends(get_db),
-    client = Depends(get_current_client)  # Layer 1: Client authentication
+    client = Depends(get_rate_limited_client)  # Layer 1: Client authentication + rate limit
 ):
     """
     Get the details of a specific tool from an MCP server.
     
     **Authentication Required**: 
-    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers)
+    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers), rate limited per client
     - Layer 2: MCP Server authentication (handled internally)
     """
-    return await MCPClientService.get_tool(db, server_id, tool_name)
+    return await MCPClientService.get_tool(server_id, tool_name)
 
 @router.post("/{server_id}/tools/{tool_name}/execute", response_model=Dict[str, Any])
 async def execute_server_tool(
     server_id: UUID,
     tool_name: str,
     parameters: Dict[str, Any],
-    db: AsyncSession = Depends(get_db),
-    client = Depends(get_current_client)  # Layer 1: Client authentication
+    cache_control: Optional[str] = Header(None, description="no-cache, no-store or max-age=N for cached tools"),
+    client = Depends(get_rate_limited_client)  # Layer 1: Client authentication + rate limit
 ):
     """
     Execute a tool on a specific MCP server.
+
+    Results of tools the server lists in metadata `cache_tools` are cached
+    (X-Cache: HIT/MISS/BYPASS). Send `Cache-Control: no-cache` to force a
+    fresh call, `no-store` to also skip storing it, or `max-age=N` to accept
+    only results at most N seconds old.
     
     **Authentication Required**: 
-    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers)
+    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers), rate limited per client
     - Layer 2: MCP Server authentication (handled internally via server's api_key)
     
     The service will use the MCP server's stored API key to authenticate with the actual MCP server.
     """
-    return await MCPClientService.execute_tool(db, server_id, tool_name, parameters)
+    body, headers = await MCPClientService.execute_tool(
+        server_id, tool_name, parameters, CachePolicy.from_header(cache_control)
+    )
+    return json_bytes_response(body, headers=headers)
+
+@router.post("/{server_id}/tools/batch-execute", response_model=BatchExecuteResponse)
+async def batch_execute_server_tools(
+    server_id: UUID,
+    batch: BatchExecuteRequest,
+    client = Depends(get_current_client)  # Layer 1: Client authentication
+):
+    """
+    Execute independent tool calls on a specific MCP server in one request.
+
+    The calls share one pooled session and run concurrently, at most
+    `parallelism` at a time. Results are returned in request order with their
+    latency; a failed call is reported in its own entry.
+
+    **Authentication Required**:
+    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers); each call counts against the rate limit
+    - Layer 2: MCP Server authentication (handled internally via server's api_key)
+    """
+    await enforce_rate_limit(client, len(batch.calls))
+    calls = [(call.tool_name, call.parameters) for call in batch.calls]
+    result = await MCPClientService.batch_execute(server_id, calls, batch.parallelism)
+    return json_bytes_response(orjson.dumps(result))
 
 @router.post("/{server_id}/reload", response_model=Dict[str, str])
 async def reload_mcp_server(
     server_id: UUID, 
-    db: AsyncSession = Depends(get_db),
-    client = Depends(get_current_client)  # Layer 1: Client authentication
+    client = Depends(get_rate_limited_client)  # Layer 1: Client authentication + rate limit
 ):
     """
     Trigger a reload on a specific MCP server.
     
     **Authentication Required**: 
-    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers)
+    - Layer 1: Client credentials (X-Client-ID, X-API-Key headers), rate limited per client
     - Layer 2: MCP Server authentication (handled internally)
     """
-    return await MCPClientService.reload_server(db, server_id)
+    return await MCPClientService.reload_server(server_id)
@@ -1,11 +1,14 @@
 # app/api/routes_mcp_server.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from app.api.dependencies import get_metadata_filter
+from app.db.metadata_filter import MetadataFilter
 from app.db.session import get_db
+from app.db.pagination import InvalidCursorError
 from app.schemas.mcp_server import MCPServerCreate, MCPServerUpdate, MCPServerResponse
 from app.services.mcp_server_services import MCPServerService
 
@@ -25,9 +28,20 @@ async def create_mcp_server(
 
 @router.get("/", response_model=List[MCPServerResponse])
 async def read_mcp_servers(
-    skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)
+    response: Response,
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    metadata_filter: Optional[MetadataFilter] = Depends(get_metadata_filter),
+    db: AsyncSession = Depends(get_db),
 ):
-    servers = await MCPServerService.get_all_servers(db, skip=skip, limit=limit)
+    try:
+        servers, next_cursor = await MCPServerService.get_all_servers(
+            db, limit=limit, cursor=cursor, metadata_filter=metadata_filter
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return servers
 
 @router.get("/{server_id}", response_model=MCPServerResponse)
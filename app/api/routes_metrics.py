@@ -0,0 +1,129 @@
+# app/api/routes_metrics.py
+
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, Any
+
+from app.db import instrumentation
+from app.db.session import engine
+from app.services.mcp_tool_cache import tool_catalog_cache
+from app.services.client_auth_cache import client_auth_cache
+from app.services.mcp_circuit_breaker import circuit_breakers
+from app.services.mcp_health import health_monitor
+from app.services.mcp_result_cache import tool_result_cache
+from app.services.mcp_server_registry import mcp_server_registry
+from app.services.single_flight import mcp_single_flight
+from app.services.rate_limiter import rate_limiter
+from app.api.dependencies import get_current_user  # Admin authentication
+
+router = APIRouter()
+
+
+@router.get("/tool-cache", response_model=Dict[str, Any])
+async def get_tool_cache_metrics(
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    Hit/miss/eviction counters of the MCP tool catalog cache.
+    """
+    return tool_catalog_cache.stats()
+
+
+@router.get("/client-auth-cache", response_model=Dict[str, Any])
+async def get_client_auth_cache_metrics(
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    Hit/miss counters of the client credential cache used by get_current_client.
+    """
+    return client_auth_cache.stats()
+
+
+@router.get("/rate-limiter", response_model=Dict[str, Any])
+async def get_rate_limiter_metrics(
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    Allowed/rejected counters of the per-client rate limiter.
+    """
+    return rate_limiter.stats()
+
+
+@router.get("/mcp-health", response_model=Dict[str, Any])
+async def get_mcp_health_metrics(
+    current_user = Depends(get_current_user),
+):
+    """
+    Background health monitor state: sweep count and duration, and the servers
+    currently considered down (requests to them fail fast with 503).
+    """
+    return health_monitor.stats()
+
+
+@router.get("/mcp-circuit-breakers", response_model=Dict[str, Any])
+async def get_mcp_circuit_breaker_metrics(
+    current_user = Depends(get_current_user),
+):
+    """
+    Circuit breaker state per MCP server (closed/open/half_open, failures,
+    rejected requests) and the current adaptive connect and call deadlines.
+    """
+    return circuit_breakers.snapshot()
+
+
+@router.get("/mcp-registry", response_model=Dict[str, Any])
+async def get_mcp_registry_metrics(
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    State of the in-memory MCP server registry: whether it is live (listener
+    connected and loaded), server count, notifications received and lookups
+    that fell back to the database.
+    """
+    return mcp_server_registry.stats()
+
+
+@router.get("/mcp-single-flight", response_model=Dict[str, Any])
+async def get_mcp_single_flight_metrics(
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    Upstream MCP requests started vs. requests that joined an identical one
+    already in flight (catalog fetches and opted-in tool calls), and requests
+    cancelled because every caller waiting on them gave up.
+    """
+    return mcp_single_flight.stats()
+
+
+@router.get("/mcp-result-cache", response_model=Dict[str, Any])
+async def get_mcp_result_cache_metrics(
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    Hit/miss/bypass/eviction counters and size of the MCP tool result cache.
+    """
+    return tool_result_cache.stats()
+
+
+@router.get("/sql", response_model=Dict[str, Any])
+async def get_sql_metrics(
+    top: int = 20,
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    SQL timing histograms (overall and for the `top` statements by total time),
+    slow-query count and per-route query counts.
+    """
+    if instrumentation.sql_metrics is None:
+        raise HTTPException(status_code=404, detail="SQL instrumentation is disabled")
+    return instrumentation.sql_metrics.snapshot(top=top)
+
+
+@router.get("/db-pool", response_model=Dict[str, Any])
+async def get_db_pool_metrics(
+    # current_user = Depends(get_current_user)  # Uncomment to require admin auth
+):
+    """
+    Connection pool occupancy: checked-out and overflow connections (current and
+    peak), checkout wait-time histogram and checkout timeouts.
+    """
+    return engine.pool.metrics()
@@ -1,5 +1,6 @@
 # app/core/config.py
 
+from typing import Literal
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -12,6 +13,87 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # -1 disables recycling
+    # Pre-ping costs a round-trip per checkout. Without it, connections are
+    # recycled after DB_POOL_RECYCLE_SECONDS and a connection found dead on use
+    # is invalidated by SQLAlchemy's disconnect detection.
+    DB_POOL_PRE_PING: bool = False
+
+    # Items
+    ITEM_STREAM_CHUNK_SIZE: int = 500  # Rows per server-side cursor fetch for NDJSON export
+    BULK_CHUNK_SIZE: int = 500  # Rows per INSERT/UPDATE/DELETE statement in bulk operations
+    BULK_MAX_ROWS: int = 10000  # Max rows per bulk request
+    INGEST_BATCH_SIZE: int = 5000  # Rows validated and COPYed into staging per batch
+    INGEST_MAX_REPORTED_ERRORS: int = 100  # Rejected rows listed in an ingestion report
+
+    # SQL logging / instrumentation
+    SQL_ECHO: bool = False  # SQLAlchemy statement echo; debugging only
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    SQL_SLOW_QUERY_MS: float = 200.0
+    SQL_LOG_SAMPLE_RATE: float = 0.0  # Fraction of non-slow statements logged at INFO
+
+    # MCP gateway session pool
+    MCP_SESSION_POOL_SIZE: int = 4  # Max concurrent sessions per MCP server
+    MCP_SESSION_ACQUIRE_TIMEOUT_SECONDS: float = 10.0
+    MCP_SESSION_MAX_IDLE_SECONDS: float = 240.0  # Must stay below the SSE read timeout (300s)
+    MCP_CONNECT_TIMEOUT_SECONDS: float = 5.0  # Handshake deadline ceiling (and default before any samples)
+
+    # MCP server registry (in-memory, refreshed via LISTEN/NOTIFY)
+    MCP_REGISTRY_ENABLED: bool = True  # When off, servers are looked up in the database per request
+    MCP_REGISTRY_RECONNECT_SECONDS: float = 5.0  # Delay before re-establishing a lost listener
+
+    # MCP tool catalog cache
+    TOOL_CACHE_TTL_SECONDS: float = 60.0
+    TOOL_CACHE_MAX_SERVERS: int = 256
+
+    # MCP tool result cache (tools opt in via MCPServer.metadata_["cache_tools"])
+    MCP_RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # Total size of cached results (LRU)
+    MCP_RESULT_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024  # Upper bound for a tool's max_entry_bytes
+
+    # Aggregate tool discovery (GET /mcp-clients/tools)
+    MCP_DISCOVERY_CONCURRENCY: int = 16  # Max servers queried at once
+    MCP_DISCOVERY_TIMEOUT_SECONDS: float = 5.0  # Per-server deadline
+
+    # Batch tool execution
+    MCP_BATCH_MAX_CALLS: int = 100  # Max calls per batch request
+    MCP_BATCH_PARALLELISM: int = 8  # Default concurrent calls per batch
+
+    # Per-server circuit breakers and adaptive deadlines
+    MCP_BREAKER_FAILURE_THRESHOLD: int = 5  # Consecutive failures that open the circuit
+    MCP_BREAKER_OPEN_SECONDS: float = 30.0  # Time before a half-open trial request
+    MCP_LATENCY_WINDOW: int = 200  # Recent latencies kept per server/operation
+    MCP_TIMEOUT_MIN_SAMPLES: int = 20  # Below this, the ceiling deadline applies
+    MCP_TIMEOUT_PERCENTILE: float = 0.99
+    MCP_TIMEOUT_MULTIPLIER: float = 3.0  # Deadline = multiplier x percentile latency
+    MCP_CONNECT_TIMEOUT_MIN_SECONDS: float = 1.0
+    MCP_CALL_TIMEOUT_MIN_SECONDS: float = 2.0
+    MCP_CALL_TIMEOUT_MAX_SECONDS: float = 60.0
+
+    # Background MCP server health checks
+    MCP_HEALTH_CHECK_ENABLED: bool = True
+    MCP_HEALTH_CHECK_INTERVAL_SECONDS: float = 30.0
+    MCP_HEALTH_CHECK_JITTER: float = 0.2  # +/- fraction of the interval; also spreads probe start times
+    MCP_HEALTH_CHECK_TIMEOUT_SECONDS: float = 5.0  # Per-server ping deadline
+    MCP_HEALTH_CHECK_CONCURRENCY: int = 16  # Max servers probed at once
+
+    # Client credential cache (get_current_client)
+    CLIENT_AUTH_CACHE_TTL_SECONDS: float = 30.0
+    CLIENT_AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+    # Client.last_accessed write-behind
+    LAST_ACCESSED_FLUSH_INTERVAL_SECONDS: float = 5.0
+    LAST_ACCESSED_RESOLUTION_SECONDS: float = 60.0
+
+    # Client rate limiting (Client.rate_limit, "count/period")
+    RATE_LIMIT_ENABLED: bool = True
+    DEFAULT_RATE_LIMIT: str = "1000/hour"
+    RATE_LIMIT_BACKEND: Literal["memory", "postgres"] = "memory"  # "postgres" shares limits across workers
+    RATE_LIMIT_LEASE_SIZE: int = 20  # Tokens reserved per round-trip to the shared store
+
     class Config:
         case_sensitive = True
 
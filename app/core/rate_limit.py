@@ -0,0 +1,30 @@
+# app/core/rate_limit.py
+
+import re
+from functools import lru_cache
+from typing import Tuple
+
+_PERIODS = {
+    "s": 1, "sec": 1, "second": 1,
+    "m": 60, "min": 60, "minute": 60,
+    "h": 3600, "hr": 3600, "hour": 3600,
+    "d": 86400, "day": 86400,
+}
+_SPEC_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*([a-z]+?)s?\s*$")
+
+
+@lru_cache(maxsize=1024)
+def parse_rate_limit(spec: str) -> Tuple[int, float]:
+    """
+    Parse a "count/period" spec such as "1000/hour" or "50/10s".
+
+    Returns (capacity, period_seconds). Raises ValueError for malformed specs.
+    """
+    match = _SPEC_RE.match(spec.lower())
+    if not match or match.group(3) not in _PERIODS:
+        raise ValueError(f"Invalid rate limit '{spec}', expected 'count/period' (e.g. '1000/hour')")
+    count = int(match.group(1))
+    multiplier = int(match.group(2) or 1)
+    if count <= 0 or multiplier <= 0:
+        raise ValueError(f"Invalid rate limit '{spec}', count and period must be positive")
+    return count, float(multiplier * _PERIODS[match.group(3)])
@@ -5,4 +5,5 @@ from app.models.item import Item
 from app.models.user import User
 from app.models.client import Client
 from app.models.mcp_server import MCPServer
-from app.models.build_registration import BuildRegistration 
+from app.models.build_registration import BuildRegistration
+from app.models.rate_limit import RateLimitCounter
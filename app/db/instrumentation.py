@@ -0,0 +1,253 @@
+# app/db/instrumentation.py
+
+import logging
+import random
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger("app.sql")
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+MAX_TRACKED_STATEMENTS = 500
+MAX_TRACKED_ROUTES = 500
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+@dataclass
+class RequestQueryStats:
+    count: int = 0
+    total_ms: float = 0.0
+
+
+@dataclass
+class RouteQueryStats:
+    requests: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    total_ms: float = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+class SQLMetrics:
+    """
+    Process-wide SQL timing: an overall histogram, one per statement text, and
+    query counts per route. Statement texts are SQLAlchemy's parameterized SQL,
+    so bound values never reach the metrics or the logs.
+    """
+
+    def __init__(self, slow_query_ms: float, sample_rate: float):
+        self.slow_query_ms = slow_query_ms
+        self.sample_rate = sample_rate
+        self.overall = LatencyHistogram()
+        self.statements: Dict[str, LatencyHistogram] = {}
+        self.routes: Dict[str, RouteQueryStats] = {}
+        self.slow_queries = 0
+
+    def record(self, statement: str, ms: float) -> None:
+        self.overall.observe(ms)
+        histogram = self.statements.get(statement)
+        if histogram is None:
+            if len(self.statements) >= MAX_TRACKED_STATEMENTS:
+                statement = "<other>"
+            histogram = self.statements.setdefault(statement, LatencyHistogram())
+        histogram.observe(ms)
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.total_ms += ms
+
+        if ms >= self.slow_query_ms:
+            self.slow_queries += 1
+            logger.warning("Slow query (%.1f ms): %s", ms, statement)
+        elif self.sample_rate and random.random() < self.sample_rate:
+            logger.info("Query (%.1f ms): %s", ms, statement)
+
+    def record_route(self, route: str, stats: RequestQueryStats) -> None:
+        """Track the number of queries issued per request for `route`."""
+        route_stats = self.routes.get(route)
+        if route_stats is None:
+            if len(self.routes) >= MAX_TRACKED_ROUTES:
+                return
+            route_stats = self.routes[route] = RouteQueryStats()
+        route_stats.requests += 1
+        route_stats.queries += stats.count
+        route_stats.total_ms += stats.total_ms
+        if stats.count > route_stats.max_queries:
+            route_stats.max_queries = stats.count
+
+    def snapshot(self, top: int = 20) -> Dict[str, Any]:
+        statements: List[Dict[str, Any]] = [
+            {"statement": statement, **histogram.snapshot()}
+            for statement, histogram in sorted(
+                self.statements.items(), key=lambda kv: kv[1].total_ms, reverse=True
+            )[:top]
+        ]
+        routes = {
+            route: {
+                "requests": route_stats.requests,
+                "queries": route_stats.queries,
+                "avg_queries": round(route_stats.queries / route_stats.requests, 2),
+                "max_queries": route_stats.max_queries,
+                "query_time_ms": round(route_stats.total_ms, 3),
+            }
+            for route, route_stats in self.routes.items()
+        }
+        return {
+            "slow_query_ms": self.slow_query_ms,
+            "sample_rate": self.sample_rate,
+            "slow_queries": self.slow_queries,
+            "overall": self.overall.snapshot(),
+            "statements": statements,
+            "routes": routes,
+        }
+
+
+sql_metrics: Optional[SQLMetrics] = None
+
+
+def instrument_engine(engine: AsyncEngine, slow_query_ms: float, sample_rate: float) -> SQLMetrics:
+    """Attach timing hooks to `engine` and return the metrics they feed."""
+    global sql_metrics
+    metrics = SQLMetrics(slow_query_ms=slow_query_ms, sample_rate=sample_rate)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start_time"].pop()
+        metrics.record(statement, (time.perf_counter() - started) * 1000)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+
+    sql_metrics = metrics
+    return metrics
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long checkouts wait for a
+    connection, how many time out, and high-water marks for checked-out and
+    overflow connections.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = LatencyHistogram()
+        self.checkout_timeouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait.observe((time.perf_counter() - started) * 1000)
+
+        checked_out = self.checkedout()
+        if checked_out > self.peak_checked_out:
+            self.peak_checked_out = checked_out
+        overflow = self.overflow()
+        if overflow > self.peak_overflow:
+            self.peak_overflow = overflow
+        return record
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout_seconds": self.timeout(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "peak_checked_out": self.peak_checked_out,
+            "peak_overflow": self.peak_overflow,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_wait": self.checkout_wait.snapshot(),
+        }
+
+
+class QueryCountMiddleware:
+    """
+    ASGI middleware counting the queries issued while handling each request.
+
+    The live counters are available to handlers as request.state.db_query_stats,
+    returned in the X-DB-Query-Count / X-DB-Query-Time-Ms headers and
+    aggregated per route.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _request_stats.set(stats)
+        scope.setdefault("state", {})["db_query_stats"] = stats
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-query-time-ms", f"{stats.total_ms:.1f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _request_stats.reset(token)
+            if sql_metrics is not None:
+                route = scope.get("route")
+                path = getattr(route, "path", None) or "<unmatched>"
+                sql_metrics.record_route(f"{scope['method']} {path}", stats)
@@ -0,0 +1,81 @@
+# app/db/metadata_filter.py
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from sqlalchemy import Select, Text, cast
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+class InvalidMetadataFilterError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class MetadataFilter:
+    """
+    Predicates on a JSONB metadata column, evaluated in the database.
+
+    `contains` becomes `column @> contains` and `has_keys` becomes
+    `column ?& has_keys`; both are served by the column's GIN index.
+    """
+    contains: Dict[str, Any] = field(default_factory=dict)
+    has_keys: List[str] = field(default_factory=list)
+
+    def apply(self, query: Select, column) -> Select:
+        if self.contains:
+            query = query.where(column.contains(self.contains))
+        if self.has_keys:
+            query = query.where(column.has_all(cast(self.has_keys, ARRAY(Text))))
+        return query
+
+
+def _parse_value(raw: str) -> Any:
+    # JSON literals (5, true, null, "5", {"a": 1}) keep their type; anything else is a string.
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+def parse_metadata_filter(
+    contains: Optional[Union[str, Dict[str, Any]]] = None,
+    where: Optional[List[str]] = None,
+    has_keys: Optional[List[str]] = None,
+) -> Optional[MetadataFilter]:
+    """
+    Build a MetadataFilter from request parameters:
+
+    - contains: a JSON object (or its text) the metadata must contain
+    - where: "key=value" predicates; dotted keys address nested objects
+      ("owner.team=search" matches {"owner": {"team": "search"}})
+    - has_keys: top-level keys that must be present
+
+    Returns None when no predicate is given.
+    """
+    if isinstance(contains, str):
+        try:
+            contains = json.loads(contains)
+        except ValueError:
+            raise InvalidMetadataFilterError("Metadata filter must be a JSON object")
+    if contains is not None and not isinstance(contains, dict):
+        raise InvalidMetadataFilterError("Metadata filter must be a JSON object")
+    merged: Dict[str, Any] = dict(contains or {})
+
+    for predicate in where or []:
+        key, sep, raw = predicate.partition("=")
+        if not sep or not key:
+            raise InvalidMetadataFilterError(f"Invalid metadata predicate {predicate!r}, expected key=value")
+        *parents, leaf = key.split(".")
+        target = merged
+        for part in parents:
+            target = target.setdefault(part, {})
+            if not isinstance(target, dict):
+                raise InvalidMetadataFilterError(f"Conflicting metadata predicates for {key!r}")
+        target[leaf] = _parse_value(raw)
+
+    keys = [key for key in has_keys or [] if key]
+    if not merged and not keys:
+        return None
+    return MetadataFilter(contains=merged, has_keys=keys)
@@ -0,0 +1,67 @@
+# app/db/pagination.py
+
+import base64
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    raw = json.dumps([str(v) if v is not None else None for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+async def fetch_keyset_page(
+    db: AsyncSession,
+    query: Select,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    parse_sort_value: Callable[[str], Any] = str,
+    scalars: bool = True,
+) -> Tuple[Sequence[Any], Optional[str]]:
+    """
+    Fetch one page of `query` ordered by (sort_column, id_column).
+
+    The cursor encodes the (sort value, id) of the last row returned, so each
+    page is an index range scan instead of an OFFSET over all previous rows.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    With scalars=False the rows are Core rows, which must include both columns.
+    """
+    if cursor:
+        sort_value, id_value = decode_cursor(cursor, 2)
+        try:
+            sort_value = parse_sort_value(sort_value)
+            id_value = id_column.type.python_type(id_value)
+        except (ValueError, TypeError):
+            raise InvalidCursorError("Invalid cursor")
+        query = query.where(tuple_(sort_column, id_column) > tuple_(sort_value, id_value))
+
+    query = query.order_by(sort_column, id_column).limit(limit + 1)
+    result = await db.execute(query)
+    rows = result.scalars().all() if scalars else result.all()
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
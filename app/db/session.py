@@ -5,13 +5,26 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from app.core.config import settings
+from app.db.instrumentation import InstrumentedAsyncPool, instrument_engine
 
 engine = create_async_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=True
+    poolclass=InstrumentedAsyncPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    echo=settings.SQL_ECHO
 )
 
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    instrument_engine(
+        engine,
+        slow_query_ms=settings.SQL_SLOW_QUERY_MS,
+        sample_rate=settings.SQL_LOG_SAMPLE_RATE,
+    )
+
 SessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession, 
@@ -0,0 +1,92 @@
+# app/db/tool_session.py
+
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.instrumentation import LatencyHistogram
+from app.db.session import SessionLocal
+
+MAX_TRACKED_TOOLS = 200
+
+
+class ToolStats:
+    __slots__ = ("calls", "errors", "duration", "connection_hold")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.duration = LatencyHistogram()
+        self.connection_hold = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "duration": self.duration.snapshot(),
+            "connection_hold": self.connection_hold.snapshot(),
+        }
+
+
+class ToolSessionMetrics:
+    """
+    Per-tool call timing. `duration` covers the whole tool body; `connection_hold`
+    runs from the session's first query (connection checkout) until it is closed,
+    i.e. how long the tool keeps a pooled connection busy.
+    """
+
+    def __init__(self):
+        self.tools: Dict[str, ToolStats] = {}
+
+    def get(self, tool_name: str) -> ToolStats:
+        stats = self.tools.get(tool_name)
+        if stats is None:
+            if len(self.tools) >= MAX_TRACKED_TOOLS:
+                tool_name = "<other>"
+            stats = self.tools.setdefault(tool_name, ToolStats())
+        return stats
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: stats.snapshot() for name, stats in sorted(self.tools.items())}
+
+
+tool_session_metrics = ToolSessionMetrics()
+
+
+@asynccontextmanager
+async def tool_session(tool_name: str) -> AsyncIterator[AsyncSession]:
+    """
+    Session scoped to one MCP tool call.
+
+    Unlike `async for session in get_db(): ... return`, which abandons the
+    generator and leaves the cleanup to garbage collection, the session is
+    always closed (rolling back anything uncommitted and returning its
+    connection to the pool) before the call returns.
+    """
+    stats = tool_session_metrics.get(tool_name)
+    stats.calls += 1
+    started = time.perf_counter()
+    checked_out_at = None
+
+    session = SessionLocal()
+
+    def _after_begin(sync_session, transaction, connection):
+        nonlocal checked_out_at
+        if checked_out_at is None:
+            checked_out_at = time.perf_counter()
+
+    event.listen(session.sync_session, "after_begin", _after_begin)
+    try:
+        yield session
+    except Exception:
+        stats.errors += 1
+        raise
+    finally:
+        await session.close()
+        finished = time.perf_counter()
+        stats.duration.observe((finished - started) * 1000)
+        if checked_out_at is not None:
+            stats.connection_hold.observe((finished - checked_out_at) * 1000)
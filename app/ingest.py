@@ -0,0 +1,62 @@
+# app/ingest.py
+"""
+Bulk-load items from a CSV or NDJSON file, e.g. for nightly catalog loads:
+
+    python -m app.ingest items.csv
+    cat items.ndjson | python -m app.ingest - --format ndjson
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator, BinaryIO
+
+from fastapi import HTTPException
+
+from app.db.session import engine
+from app.services.item_ingestion import ItemIngestionService
+
+READ_SIZE = 1 << 20
+
+
+async def _read_chunks(stream: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(stream.read, READ_SIZE):
+        yield chunk
+
+
+async def _run(args: argparse.Namespace) -> int:
+    stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    try:
+        report = await ItemIngestionService.ingest(_read_chunks(stream), args.format, batch_size=args.batch_size)
+    except HTTPException as e:
+        print(e.detail, file=sys.stderr)
+        return 1
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        await engine.dispose()
+
+    print(report.model_dump_json(indent=2))
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load items from CSV or NDJSON.")
+    parser.add_argument("path", help="input file, or - for stdin")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=None, help="rows per COPY batch")
+    args = parser.parse_args()
+
+    if args.format is None:
+        if args.path.endswith(".csv"):
+            args.format = "csv"
+        elif args.path.endswith((".ndjson", ".jsonl")):
+            args.format = "ndjson"
+        else:
+            parser.error("--format is required when it can't be inferred from the file name")
+
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
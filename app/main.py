@@ -1,6 +1,7 @@
 # app/main.py
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.api.routes_item import router as item_router
 from app.api.routes_user import router as user_router
@@ -9,16 +10,33 @@ from app.api.routes_mcp_server import router as mcp_server_router
 from app.api.routes_mcp_client import router as mcp_client_router
 from app.api.routes_registration import router as registration_router
 from app.api.routes_client import router as client_router
+from app.api.routes_metrics import router as metrics_router
+from app.db.instrumentation import QueryCountMiddleware
+from app.services.mcp_session_pool import mcp_session_pool
+from app.services.client_activity import last_access_recorder
+from app.services.mcp_health import health_monitor
+from app.services.mcp_server_registry import mcp_server_registry
+from app.core.config import settings
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Code chạy khi khởi động (startup)
     print("🚀 App is starting...")
+    last_access_recorder.start()
+    if settings.MCP_REGISTRY_ENABLED:
+        mcp_server_registry.start()
+    if settings.MCP_HEALTH_CHECK_ENABLED:
+        health_monitor.start()
     yield
     # Code chạy khi shutdown
     print("👋 App is shutting down...")
+    await health_monitor.stop()
+    await mcp_server_registry.stop()
+    await mcp_session_pool.close()
+    await last_access_recorder.stop()
 
-app = FastAPI(title="MCP Test API", lifespan=lifespan)
+app = FastAPI(title="MCP Test API", lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(QueryCountMiddleware)
 
 # Include routers
 app.include_router(item_router)
@@ -28,3 +46,4 @@ app.include_router(client_router, prefix="/api/v1/clients", tags=["clients"])
 app.include_router(mcp_server_router, prefix="/api/v1/mcp-servers", tags=["mcp-servers"])
 app.include_router(mcp_client_router, prefix="/api/v1/mcp-clients", tags=["mcp-clients"])
 app.include_router(registration_router, prefix="/api/v1", tags=["registrations"])
+app.include_router(metrics_router, prefix="/api/v1/metrics", tags=["metrics"])
@@ -1,8 +1,20 @@
 # app/mcp/mcp_server.py
 
 import asyncio
-from app.mcp_local.mcp_tools import mcp  
+from app.db.session import engine
+from app.mcp_local.mcp_tools import mcp
+
+
+async def serve(**transport_kwargs):
+    # FastMCP's lifespan runs once per client connection under SSE, so the
+    # process, not the lifespan, owns the engine: its pool is shared by all
+    # connections and disposed once when the server stops.
+    try:
+        await mcp.run_async(**transport_kwargs)
+    finally:
+        await engine.dispose()
+
 
 if __name__ == "__main__":
-    # asyncio.run(mcp.run(transport='stdio'))
-    asyncio.run(mcp.run(transport='sse', host='127.0.0.1', port=8099))
+    # asyncio.run(serve(transport='stdio'))
+    asyncio.run(serve(transport='sse', host='127.0.0.1', port=8099))
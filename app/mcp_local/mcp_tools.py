@@ -1,33 +1,107 @@
 # app/mcp/mcp_tools.py
 
+import json
 from sqlalchemy import select
-from typing import Optional, Dict, Any
-from app.db.session import get_db
-from app.models.item import Item
+from typing import Optional, Dict, Any, List
+from app.core.config import settings
+from app.db.tool_session import tool_session, tool_session_metrics
+from app.db.metadata_filter import InvalidMetadataFilterError, parse_metadata_filter
+from app.db.pagination import InvalidCursorError
+from app.models.item import Item, ItemType
+from app.repositories.item import ItemRepository, resolve_item_fields
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 mcp = FastMCP("item-mcp")
 
+MAX_PAGE_SIZE = 1000
+
+
+@mcp.custom_route("/metrics/tools", methods=["GET"])
+async def tool_metrics(request: Request) -> JSONResponse:
+    """Per-tool call counts, latency and DB connection hold time."""
+    return JSONResponse(tool_session_metrics.snapshot())
+
+
+def _item_to_dict(item: Item) -> dict:
+    return {
+        "id": str(item.id),
+        "name": item.name,
+        "description": item.description,
+        "quantity": item.quantity,
+        "type": item.item_type,
+        "metadata": item.item_metadata,
+    }
+
+
+# Keys of _item_to_dict that differ from the column names.
+_OUTPUT_KEYS = {"item_type": "type", "item_metadata": "metadata"}
+
+
+def _row_to_dict(row, fields: List[str]) -> dict:
+    """Like _item_to_dict, for a projected Core row holding only `fields`."""
+    data = {_OUTPUT_KEYS.get(name, name): row._mapping[name] for name in fields}
+    data["id"] = str(data["id"])
+    return data
+
+
+def _serialize(items, fields: Optional[List[str]]) -> List[dict]:
+    if fields:
+        return [_row_to_dict(row, fields) for row in items]
+    return [_item_to_dict(item) for item in items]
+
 
 @mcp.tool()
-async def list_items() -> list[dict]:
-    """
-    Get all items from the database.
-    """
-    async for session in get_db():
-        result = await session.execute(select(Item))
-        items = result.scalars().all()
-        return [
-            {
-                "id": str(item.id),
-                "name": item.name,
-                "description": item.description,
-                "quantity": item.quantity,
-                "type": item.item_type,
-                "metadata": item.item_metadata,
-            }
-            for item in items
-        ]
+async def list_items(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    fields: Optional[List[str]] = None,
+) -> dict:
+    """
+    Get items from the database ordered by name, one page at a time.
+    Pass the returned `next_cursor` as `cursor` to get the next page;
+    `next_cursor` is null on the last page.
+    Use view="lite" (id, name, type) or `fields` (column names) to return less data.
+    """
+    try:
+        columns = resolve_item_fields(view, ",".join(fields) if fields else None)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+
+    async with tool_session("list_items") as session:
+        repo = ItemRepository(session)
+        try:
+            items, next_cursor = await repo.get_page(
+                limit=max(1, min(limit, MAX_PAGE_SIZE)), cursor=cursor, fields=columns
+            )
+        except InvalidCursorError:
+            return {"status": "error", "message": "Invalid cursor"}
+        return {
+            "items": _serialize(items, columns),
+            "next_cursor": next_cursor,
+        }
+
+
+@mcp.tool()
+async def export_items(chunk_size: int = 500, cursor: Optional[str] = None) -> dict:
+    """
+    Export items as NDJSON text (one JSON object per line), ordered by name,
+    in chunks of `chunk_size`. Pass the returned `next_cursor` as `cursor` to
+    get the next chunk; `next_cursor` is null after the last chunk.
+    """
+    async with tool_session("export_items") as session:
+        repo = ItemRepository(session)
+        try:
+            items, next_cursor = await repo.get_page(limit=max(1, min(chunk_size, MAX_PAGE_SIZE)), cursor=cursor)
+        except InvalidCursorError:
+            return {"status": "error", "message": "Invalid cursor"}
+        return {
+            "ndjson": "".join(json.dumps(_item_to_dict(item), default=str) + "\n" for item in items),
+            "count": len(items),
+            "next_cursor": next_cursor,
+        }
 
 
 @mcp.tool()
@@ -41,7 +115,7 @@ async def add_item(
     """
     Add a new item to the database.
     """
-    async for session in get_db():
+    async with tool_session("add_item") as session:
         item = Item(
             name=name,
             description=description,
@@ -73,7 +147,7 @@ async def update_item(
     """
     Update an existing item in the database.
     """
-    async for session in get_db():
+    async with tool_session("update_item") as session:
         result = await session.execute(select(Item).where(Item.id == item_id))
         item = result.scalar_one_or_none()
 
@@ -108,7 +182,7 @@ async def delete_item(item_id: str) -> dict:
     """
     Delete an item from the database.
     """
-    async for session in get_db():
+    async with tool_session("delete_item") as session:
         result = await session.execute(select(Item).where(Item.id == item_id))
         item = result.scalar_one_or_none()
 
@@ -121,36 +195,98 @@ async def delete_item(item_id: str) -> dict:
         return {"status": "deleted", "id": item_id}
 
 
+@mcp.tool()
+async def bulk_add_items(items: List[Dict[str, Any]]) -> dict:
+    """
+    Add many items in one transaction. Each item takes the same fields as add_item
+    (name, description, quantity, item_type, item_metadata). Returns per-item results.
+    """
+    if len(items) > settings.BULK_MAX_ROWS:
+        return {"status": "error", "message": f"At most {settings.BULK_MAX_ROWS} items per call"}
+    async with tool_session("bulk_add_items") as session:
+        response = await ItemRepository(session).bulk_create(items, chunk_size=settings.BULK_CHUNK_SIZE)
+        return response.model_dump(mode="json")
+
+
+@mcp.tool()
+async def bulk_update_items(items: List[Dict[str, Any]]) -> dict:
+    """
+    Update many items in one transaction. Each item needs `id` plus the fields to change.
+    Returns per-item results.
+    """
+    if len(items) > settings.BULK_MAX_ROWS:
+        return {"status": "error", "message": f"At most {settings.BULK_MAX_ROWS} items per call"}
+    async with tool_session("bulk_update_items") as session:
+        response = await ItemRepository(session).bulk_update(items, chunk_size=settings.BULK_CHUNK_SIZE)
+        return response.model_dump(mode="json")
+
+
+@mcp.tool()
+async def bulk_delete_items(item_ids: List[str]) -> dict:
+    """
+    Delete many items by id in one transaction. Returns per-item results.
+    """
+    if len(item_ids) > settings.BULK_MAX_ROWS:
+        return {"status": "error", "message": f"At most {settings.BULK_MAX_ROWS} items per call"}
+    async with tool_session("bulk_delete_items") as session:
+        response = await ItemRepository(session).bulk_delete(item_ids, chunk_size=settings.BULK_CHUNK_SIZE)
+        return response.model_dump(mode="json")
+
+
 @mcp.tool()
 async def search_items(
+    query: Optional[str] = None,
+    mode: str = "substring",
     name: Optional[str] = None,
     item_type: Optional[str] = None,
     min_quantity: Optional[int] = None,
-) -> list[dict]:
+    metadata: Optional[Dict[str, Any]] = None,
+    metadata_keys: Optional[List[str]] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    fields: Optional[List[str]] = None,
+) -> dict:
     """
     Search items based on various criteria.
+
+    - query: text to look for in name and description
+    - mode: "substring" (default) or "fulltext" (ranked; supports "a OR b", "-a", "quoted phrases")
+    - name / item_type / min_quantity: extra filters
+    - metadata: object the item_metadata must contain, e.g. {"color": "red"}
+    - metadata_keys: keys item_metadata must have
+    - view="lite" (id, name, type) or `fields` (column names): return less data
+
+    Returns {"items": [...], "next_cursor": ...}; pass next_cursor back to get the next page.
     """
-    async for session in get_db():
-        query = select(Item)
-
-        if name:
-            query = query.where(Item.name.ilike(f"%{name}%"))
-        if item_type:
-            query = query.where(Item.item_type == item_type)
-        if min_quantity is not None:
-            query = query.where(Item.quantity >= min_quantity)
-
-        result = await session.execute(query)
-        items = result.scalars().all()
-
-        return [
-            {
-                "id": str(item.id),
-                "name": item.name,
-                "description": item.description,
-                "quantity": item.quantity,
-                "type": item.item_type,
-                "metadata": item.item_metadata,
-            }
-            for item in items
-        ]
\ No newline at end of file
+    if mode not in ("substring", "fulltext"):
+        return {"status": "error", "message": "mode must be 'substring' or 'fulltext'"}
+    try:
+        parsed_type = ItemType(item_type) if item_type else None
+    except ValueError:
+        return {"status": "error", "message": f"Unknown item_type: {item_type}"}
+    try:
+        metadata_filter = parse_metadata_filter(metadata, has_keys=metadata_keys)
+    except InvalidMetadataFilterError as e:
+        return {"status": "error", "message": str(e)}
+    try:
+        columns = resolve_item_fields(view, ",".join(fields) if fields else None)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+
+    async with tool_session("search_items") as session:
+        try:
+            items, next_cursor = await ItemRepository(session).search(
+                query=query,
+                mode=mode,
+                name=name,
+                item_type=parsed_type,
+                min_quantity=min_quantity,
+                metadata_filter=metadata_filter,
+                limit=max(1, min(limit, MAX_PAGE_SIZE)),
+                cursor=cursor,
+                fields=columns,
+            )
+        except InvalidCursorError as e:
+            return {"status": "error", "message": str(e)}
+        return {"items": _serialize(items, columns), "next_cursor": next_cursor}
\ No newline at end of file
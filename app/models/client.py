@@ -1,6 +1,6 @@
 # app/models/client.py
 
-from sqlalchemy import Column, String, Boolean, DateTime, func
+from sqlalchemy import Column, String, Boolean, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.session import Base
 import uuid
@@ -12,6 +12,9 @@ class Client(Base):
     and use MCP servers through it.
     """
     __tablename__ = "clients"
+    __table_args__ = (
+        Index("ix_clients_created_at_id", "created_at", "id"),  # Keyset pagination order
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     client_name = Column(String, nullable=False, unique=True, index=True)
@@ -1,7 +1,7 @@
 # app/models/item.py
 
-from sqlalchemy import Column, String, Integer, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID, ENUM
+from sqlalchemy import Column, String, Integer, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import UUID, ENUM, JSONB
 from datetime import datetime
 from uuid import uuid4
 from enum import Enum
@@ -14,8 +14,27 @@ class ItemType(str, Enum):
     TYPE_C = "TypeC"
 
 
+# Full-text document of an item. Search queries must use this exact expression
+# for Postgres to match it against the ix_items_search_tsv expression index.
+ITEM_SEARCH_CONFIG = "simple"
+ITEM_SEARCH_DOCUMENT = (
+    f"to_tsvector('{ITEM_SEARCH_CONFIG}', coalesce(name, '') || ' ' || coalesce(description, ''))"
+)
+
+
 class Item(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        Index("ix_items_name_id", "name", "id"),  # Keyset pagination order
+        # Trigram indexes serve ILIKE '%term%' substring search (pg_trgm)
+        Index("ix_items_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index(
+            "ix_items_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        Index("ix_items_search_tsv", text(ITEM_SEARCH_DOCUMENT), postgresql_using="gin"),
+        Index("ix_items_item_metadata_gin", "item_metadata", postgresql_using="gin"),  # @> and ?& filters
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String, nullable=False)
@@ -24,7 +43,7 @@ class Item(Base):
 
     item_type = Column(ENUM(ItemType, name="item_type"), nullable=False)
 
-    item_metadata = Column(JSON, default=dict)
+    item_metadata = Column(JSONB, default=dict)
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -6,18 +6,22 @@ from sqlalchemy import (
     Integer,
     Boolean,
     DateTime,
-    JSON,
+    Index,
     func,
 )
 from sqlalchemy.orm import relationship
 from app.db.session import Base
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from app.models.build_registration import BuildRegistration
 import uuid
 
 
 class MCPServer(Base):
     __tablename__ = "mcp_servers"
+    __table_args__ = (
+        Index("ix_mcp_servers_name_id", "name", "id"),  # Keyset pagination order
+        Index("ix_mcp_servers_metadata_gin", "metadata", postgresql_using="gin"),  # @> and ?& filters
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False, unique=True, index=True)
@@ -31,6 +35,6 @@ class MCPServer(Base):
     updated_at = Column(DateTime, onupdate=func.now())
     last_health_check = Column(DateTime, nullable=True)
     status = Column(String, default="UNKNOWN")
-    metadata_ = Column("metadata", JSON, nullable=True)
+    metadata_ = Column("metadata", JSONB, nullable=True)
 
     registrations = relationship("BuildRegistration", back_populates="server")
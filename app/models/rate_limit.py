@@ -0,0 +1,18 @@
+# app/models/rate_limit.py
+
+from sqlalchemy import Column, String, Integer, BigInteger
+from app.db.session import Base
+
+
+class RateLimitCounter(Base):
+    """
+    Shared fixed-window request counter used by the Postgres rate-limit backend.
+    One row per (bucket_key, window_start); workers reserve tokens in chunks.
+    """
+    __tablename__ = "rate_limit_counters"
+
+    bucket_key = Column(String, primary_key=True)
+    window_start = Column(BigInteger, primary_key=True)  # Unix epoch seconds
+    window_seconds = Column(Integer, nullable=False)  # The window ends at window_start + window_seconds
+    used = Column(Integer, nullable=False, default=0)
+    last_grant = Column(Integer, nullable=False, default=0)  # Tokens granted by the latest reservation
@@ -1,12 +1,83 @@
 # app/repositories/item.py
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Float, Row, and_, delete, func, insert, literal_column, or_, select, update
 
-from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.db.metadata_filter import MetadataFilter
+from app.db.pagination import InvalidCursorError, decode_cursor, encode_cursor, fetch_keyset_page
+from app.models.item import ITEM_SEARCH_CONFIG, ITEM_SEARCH_DOCUMENT, Item, ItemType
+from app.schemas.item import (
+    BulkItemResponse,
+    BulkItemResult,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemReadLite,
+    ItemUpdate,
+)
+
+# Columns that can be requested with `fields=`; view=lite selects ItemReadLite's.
+ITEM_COLUMNS = {column.key: column for column in Item.__table__.c}
+LITE_FIELDS = tuple(ItemReadLite.model_fields)
+
+# (index in the request, row values)
+BulkRow = Tuple[int, Dict[str, Any]]
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}" for err in error.errors()
+    )
+
+
+def resolve_item_fields(view: Optional[str] = None, fields: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Columns to project for a `view`/`fields` request, or None for full ORM items.
+    `fields` is a comma-separated list and wins over `view`; `id` is always included.
+    """
+    if fields:
+        names = list(dict.fromkeys(["id"] + [name.strip() for name in fields.split(",") if name.strip()]))
+        unknown = [name for name in names if name not in ITEM_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(ITEM_COLUMNS)}")
+        return names
+    if view == "lite":
+        return list(LITE_FIELDS)
+    if view in (None, "full"):
+        return None
+    raise ValueError("view must be 'full' or 'lite'")
+
+
+def project_rows(rows: Sequence[Row], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """Plain dicts of the requested columns of projected rows."""
+    return [{name: row._mapping[name] for name in fields} for row in rows]
+
+
+def _select_items(fields: Optional[Sequence[str]] = None):
+    # Projections always carry (name, id) as well: they're the keyset sort key.
+    if not fields:
+        return select(Item)
+    names = dict.fromkeys(list(fields) + ["name", "id"])
+    return select(*[ITEM_COLUMNS[name] for name in names])
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _chunks(rows: List[BulkRow], size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _bulk_response(results: List[BulkItemResult]) -> BulkItemResponse:
+    failed = sum(1 for result in results if result.status == "error")
+    return BulkItemResponse(succeeded=len(results) - failed, failed=failed, results=results)
 
 
 class ItemRepository:
@@ -24,15 +95,122 @@ class ItemRepository:
             await self.db.rollback()
             raise e
 
-    async def get_all(self) -> List[Item]:
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        metadata_filter: Optional[MetadataFilter] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[Sequence[Any], Optional[str]]:
+        """
+        Items ordered by (name, id), one keyset page at a time.
+        With `fields`, only those columns are selected and Core rows are returned
+        instead of ORM items (no identity map, no unused JSON decoding).
+        """
+        query = _select_items(fields)
+        if metadata_filter:
+            query = metadata_filter.apply(query, Item.item_metadata)
+        try:
+            return await fetch_keyset_page(
+                self.db, query, Item.name, Item.id, limit, cursor, scalars=not fields
+            )
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+    async def stream_rows(
+        self,
+        chunk_size: int = 500,
+        metadata_filter: Optional[MetadataFilter] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Yield all items in (name, id) order as Core rows, `chunk_size` at a time.
+        Uses a server-side cursor, so memory stays constant regardless of table size.
+        """
+        stmt = select(*[ITEM_COLUMNS[name] for name in fields]) if fields else select(Item.__table__)
+        if metadata_filter:
+            stmt = metadata_filter.apply(stmt, Item.item_metadata)
+        stmt = stmt.order_by(Item.name, Item.id).execution_options(yield_per=chunk_size)
+        result = await self.db.stream(stmt)
+        async for rows in result.partitions(chunk_size):
+            yield rows
+
+    async def search(
+        self,
+        query: Optional[str] = None,
+        mode: str = "substring",
+        name: Optional[str] = None,
+        item_type: Optional[ItemType] = None,
+        min_quantity: Optional[int] = None,
+        metadata_filter: Optional[MetadataFilter] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[Sequence[Any], Optional[str]]:
+        """
+        Search items, one keyset page at a time. Returns (items, next_cursor).
+
+        mode="substring": `query` matches anywhere in name or description
+        (ILIKE, served by the pg_trgm GIN indexes for terms of 3+ characters),
+        ordered by (name, id).
+        mode="fulltext": `query` uses websearch syntax ("a b", "a OR b", "-a",
+        quoted phrases) against the ITEM_SEARCH_DOCUMENT tsvector index, ordered
+        by relevance (ts_rank_cd) then id.
+
+        `name`, `item_type`, `min_quantity` and `metadata_filter` further filter
+        the results. With `fields`, Core rows of those columns are returned.
+        """
+        stmt = _select_items(fields)
+        if name:
+            stmt = stmt.where(Item.name.ilike(_like_pattern(name), escape="\\"))
+        if item_type is not None:
+            stmt = stmt.where(Item.item_type == item_type)
+        if min_quantity is not None:
+            stmt = stmt.where(Item.quantity >= min_quantity)
+        if metadata_filter:
+            stmt = metadata_filter.apply(stmt, Item.item_metadata)
+
         try:
-            stmt = select(Item).order_by(Item.name)
-            result = await self.db.execute(stmt)
-            return result.scalars().all()
+            if mode == "fulltext" and query:
+                return await self._ranked_page(stmt, query, limit, cursor, projected=bool(fields))
+            if query:
+                pattern = _like_pattern(query)
+                stmt = stmt.where(or_(
+                    Item.name.ilike(pattern, escape="\\"),
+                    Item.description.ilike(pattern, escape="\\"),
+                ))
+            return await fetch_keyset_page(
+                self.db, stmt, Item.name, Item.id, limit, cursor, scalars=not fields
+            )
         except Exception as e:
             await self.db.rollback()
             raise e
 
+    async def _ranked_page(
+        self, stmt, query: str, limit: int, cursor: Optional[str], projected: bool = False
+    ) -> Tuple[Sequence[Any], Optional[str]]:
+        document = literal_column(ITEM_SEARCH_DOCUMENT)
+        ts_query = func.websearch_to_tsquery(literal_column(f"'{ITEM_SEARCH_CONFIG}'::regconfig"), query)
+        rank = func.ts_rank_cd(document, ts_query, type_=Float)
+        stmt = stmt.add_columns(rank.label("rank")).where(document.op("@@")(ts_query))
+
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, 2)
+            try:
+                last_rank, last_id = float(last_rank), UUID(last_id)
+            except (ValueError, TypeError):
+                raise InvalidCursorError("Invalid cursor")
+            stmt = stmt.where(or_(rank < last_rank, and_(rank == last_rank, Item.id > last_id)))
+
+        rows = (await self.db.execute(stmt.order_by(rank.desc(), Item.id).limit(limit + 1))).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.rank, last.id if projected else last.Item.id)
+        return (rows if projected else [row.Item for row in rows]), next_cursor
+
     async def get_by_id(self, item_id: UUID) -> Optional[Item]:
         try:
             result = await self.db.execute(select(Item).where(Item.id == item_id))
@@ -60,3 +238,127 @@ class ItemRepository:
         except Exception as e:
             await self.db.rollback()
             raise e
+
+    async def _apply_chunk(
+        self,
+        chunk: List[BulkRow],
+        apply: Callable[[List[BulkRow]], Awaitable[Dict[int, UUID]]],
+        status: str,
+        results: List[Optional[BulkItemResult]],
+    ) -> None:
+        """
+        Apply `chunk` inside a savepoint. If the database rejects it, retry row by
+        row so only the offending rows are reported as errors. `apply` returns the
+        ids of the rows it changed; it records its own errors for the others.
+        """
+        try:
+            async with self.db.begin_nested():
+                ids = await apply(chunk)
+        except DBAPIError as e:
+            if len(chunk) == 1:
+                index = chunk[0][0]
+                results[index] = BulkItemResult(index=index, status="error", error=str(e.orig))
+                return
+            for row in chunk:
+                await self._apply_chunk([row], apply, status, results)
+            return
+
+        for index, item_id in ids.items():
+            results[index] = BulkItemResult(index=index, status=status, id=item_id)
+
+    async def _run_bulk(
+        self,
+        rows: List[BulkRow],
+        apply: Callable[[List[BulkRow]], Awaitable[Dict[int, UUID]]],
+        status: str,
+        results: List[Optional[BulkItemResult]],
+        chunk_size: int,
+    ) -> BulkItemResponse:
+        try:
+            for chunk in _chunks(rows, chunk_size):
+                await self._apply_chunk(chunk, apply, status, results)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+        return _bulk_response(results)
+
+    async def bulk_create(self, rows: List[Dict[str, Any]], chunk_size: int = 500) -> BulkItemResponse:
+        """
+        Insert many items in one transaction using multi-row INSERT ... RETURNING,
+        `chunk_size` rows per statement. Invalid rows are reported, not inserted.
+        """
+        results: List[Optional[BulkItemResult]] = [None] * len(rows)
+        valid: List[BulkRow] = []
+        for index, row in enumerate(rows):
+            try:
+                valid.append((index, ItemCreate.model_validate(row).model_dump()))
+            except ValidationError as e:
+                results[index] = BulkItemResult(index=index, status="error", error=format_validation_error(e))
+
+        async def apply(chunk: List[BulkRow]) -> Dict[int, UUID]:
+            result = await self.db.execute(
+                insert(Item).returning(Item.id, sort_by_parameter_order=True),
+                [values for _, values in chunk],
+            )
+            return {index: item_id for (index, _), item_id in zip(chunk, result.scalars().all())}
+
+        return await self._run_bulk(valid, apply, "created", results, chunk_size)
+
+    async def bulk_update(self, rows: List[Dict[str, Any]], chunk_size: int = 500) -> BulkItemResponse:
+        """
+        Update many items by primary key in one transaction (executemany UPDATE).
+        Each row must contain `id` plus at least one field to change.
+        """
+        results: List[Optional[BulkItemResult]] = [None] * len(rows)
+        valid: List[BulkRow] = []
+        for index, row in enumerate(rows):
+            try:
+                values = ItemBulkUpdate.model_validate(row).model_dump(exclude_unset=True)
+            except ValidationError as e:
+                results[index] = BulkItemResult(index=index, status="error", error=format_validation_error(e))
+                continue
+            if len(values) == 1:
+                results[index] = BulkItemResult(index=index, status="error", id=values["id"], error="No fields to update")
+                continue
+            valid.append((index, values))
+
+        async def apply(chunk: List[BulkRow]) -> Dict[int, UUID]:
+            ids = {values["id"] for _, values in chunk}
+            existing = set((await self.db.execute(select(Item.id).where(Item.id.in_(ids)))).scalars())
+            found = [(index, values) for index, values in chunk if values["id"] in existing]
+            for index, values in chunk:
+                if values["id"] not in existing:
+                    results[index] = BulkItemResult(index=index, status="error", id=values["id"], error="Item not found")
+            if found:
+                now = datetime.utcnow()
+                await self.db.execute(
+                    update(Item).execution_options(synchronize_session=False),
+                    [{**values, "updated_at": now} for _, values in found],
+                )
+            return {index: values["id"] for index, values in found}
+
+        return await self._run_bulk(valid, apply, "updated", results, chunk_size)
+
+    async def bulk_delete(self, item_ids: List[str], chunk_size: int = 500) -> BulkItemResponse:
+        """Delete many items in one transaction with DELETE ... WHERE id IN (...) RETURNING id."""
+        results: List[Optional[BulkItemResult]] = [None] * len(item_ids)
+        valid: List[BulkRow] = []
+        for index, raw_id in enumerate(item_ids):
+            try:
+                valid.append((index, {"id": UUID(str(raw_id))}))
+            except ValueError:
+                results[index] = BulkItemResult(index=index, status="error", error="Invalid item id")
+
+        async def apply(chunk: List[BulkRow]) -> Dict[int, UUID]:
+            ids = {values["id"] for _, values in chunk}
+            result = await self.db.execute(
+                delete(Item).where(Item.id.in_(ids)).returning(Item.id).execution_options(synchronize_session=False)
+            )
+            deleted = set(result.scalars())
+            for index, values in chunk:
+                if values["id"] not in deleted:
+                    results[index] = BulkItemResult(index=index, status="error", id=values["id"], error="Item not found")
+            return {index: values["id"] for index, values in chunk if values["id"] in deleted}
+
+        return await self._run_bulk(valid, apply, "deleted", results, chunk_size)
@@ -1,9 +1,17 @@
 # app/schemas/client.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
+from app.core.rate_limit import parse_rate_limit
+
+
+def _validate_rate_limit(value: Optional[str]) -> Optional[str]:
+    """Reject rate limits the rate limiter can't parse ("count/period")."""
+    if value is not None:
+        parse_rate_limit(value)
+    return value
 
 
 class ClientBase(BaseModel):
@@ -14,7 +22,8 @@ class ClientBase(BaseModel):
 
 class ClientCreate(ClientBase):
     """Schema for creating a new client"""
-    pass
+
+    validate_rate_limit = field_validator("rate_limit")(_validate_rate_limit)
 
 
 class ClientUpdate(BaseModel):
@@ -24,6 +33,8 @@ class ClientUpdate(BaseModel):
     is_active: Optional[bool] = None
     rate_limit: Optional[str] = None
 
+    validate_rate_limit = field_validator("rate_limit")(_validate_rate_limit)
+
 
 class ClientResponse(ClientBase):
     """Schema for client response (without sensitive data)"""
@@ -45,6 +56,19 @@ class ClientWithApiKey(ClientResponse):
         from_attributes = True
 
 
+class ClientIdentity(BaseModel):
+    """Snapshot of an authenticated client, as returned by get_current_client"""
+    id: UUID
+    client_id: str
+    client_name: str
+    is_active: bool
+    rate_limit: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
+
 class ClientAuth(BaseModel):
     """Schema for client authentication"""
     client_id: str = Field(..., description="Client ID")
@@ -1,7 +1,7 @@
 # app/schemas/item.py
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from app.models.item import ItemType
@@ -47,3 +47,41 @@ class ItemRead(ItemBase):
         populate_by_name = True
         orm_mode = True
         allow_population_by_field_name = True
+
+
+class ItemBulkUpdate(ItemUpdate):
+    id: UUID
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: str  # "created" | "updated" | "deleted" | "error"
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class BulkItemResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class ItemIngestRow(ItemCreate):
+    # Rows with an id are upserted; rows without one get a new id.
+    id: Optional[UUID] = None
+
+
+class IngestRejectedRow(BaseModel):
+    line: int
+    error: str
+
+
+class ItemIngestReport(BaseModel):
+    received: int
+    loaded: int
+    inserted: int
+    updated: int
+    rejected: int
+    rejected_rows: List[IngestRejectedRow]
+    elapsed_seconds: float
+    rows_per_second: float
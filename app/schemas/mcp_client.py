@@ -0,0 +1,59 @@
+# app/schemas/mcp_client.py
+
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+from uuid import UUID
+
+
+class ServerToolsResult(BaseModel):
+    server_id: UUID
+    server_name: str
+    status: Literal["ok", "timeout", "error"]
+    cached: bool = False
+    elapsed_ms: float
+    tools: List[Dict[str, Any]] = []
+    error: Optional[str] = None
+
+
+class ToolDiscoveryResponse(BaseModel):
+    servers: List[ServerToolsResult]
+    total_tools: int
+    succeeded: int
+    failed: int
+    elapsed_ms: float
+
+
+class ToolCall(BaseModel):
+    tool_name: str
+    parameters: Dict[str, Any] = {}
+
+
+class ServerToolCall(ToolCall):
+    server_id: UUID
+
+
+class BatchExecuteRequest(BaseModel):
+    calls: List[ToolCall] = Field(..., min_length=1)
+    parallelism: Optional[int] = Field(None, ge=1, le=64)
+
+
+class CrossServerBatchExecuteRequest(BaseModel):
+    calls: List[ServerToolCall] = Field(..., min_length=1)
+    parallelism: Optional[int] = Field(None, ge=1, le=64)
+
+
+class ToolCallResult(BaseModel):
+    index: int
+    server_id: UUID
+    tool_name: str
+    status: Literal["ok", "error"]
+    latency_ms: float
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class BatchExecuteResponse(BaseModel):
+    results: List[ToolCallResult]
+    succeeded: int
+    failed: int
+    elapsed_ms: float
@@ -0,0 +1,107 @@
+# app/services/client_activity.py
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import Update, column, or_, update, values, DateTime
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from app.core.config import settings
+from app.db.session import transactional_session
+from app.models.client import Client
+
+logger = logging.getLogger(__name__)
+
+
+class LastAccessRecorder:
+    """
+    Write-behind buffer for Client.last_accessed.
+
+    Requests only record a timestamp in memory; a background task writes all
+    pending timestamps in one UPDATE ... FROM (VALUES ...) every flush interval.
+    A client is recorded at most once per `resolution` seconds, so busy clients
+    cost one row write per resolution window instead of one per request.
+    """
+
+    def __init__(self, flush_interval: float, resolution: float):
+        self.flush_interval = flush_interval
+        self.resolution = resolution
+        self._pending: Dict[UUID, datetime] = {}
+        self._last_recorded: Dict[UUID, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def touch(self, client_uuid: UUID) -> None:
+        now = time.monotonic()
+        last = self._last_recorded.get(client_uuid)
+        if last is not None and now - last < self.resolution:
+            return
+        self._last_recorded[client_uuid] = now
+        self._pending[client_uuid] = datetime.utcnow()
+
+    @staticmethod
+    def _build_update(pending: Dict[UUID, datetime]) -> Update:
+        rows = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("ts", DateTime()),
+            name="v",
+        ).data(list(pending.items()))
+        return (
+            update(Client)
+            .where(Client.id == rows.c.id)
+            .where(or_(Client.last_accessed.is_(None), Client.last_accessed < rows.c.ts))
+            .values(last_accessed=rows.c.ts)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _prune(self) -> None:
+        # Entries older than the resolution no longer debounce anything.
+        cutoff = time.monotonic() - self.resolution
+        for client_uuid in [key for key, last in self._last_recorded.items() if last <= cutoff]:
+            del self._last_recorded[client_uuid]
+
+    async def flush(self) -> int:
+        """Write all pending timestamps; returns the number of clients flushed."""
+        self._prune()
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        try:
+            async with transactional_session() as session:
+                await session.execute(self._build_update(pending))
+        except Exception:
+            logger.exception("Failed to flush last_accessed for %d clients", len(pending))
+            # Re-queue, keeping any newer timestamp recorded meanwhile.
+            for client_uuid, ts in pending.items():
+                self._pending.setdefault(client_uuid, ts)
+            return 0
+        return len(pending)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+last_access_recorder = LastAccessRecorder(
+    flush_interval=settings.LAST_ACCESSED_FLUSH_INTERVAL_SECONDS,
+    resolution=settings.LAST_ACCESSED_RESOLUTION_SECONDS,
+)
@@ -0,0 +1,92 @@
+# app/services/client_auth_cache.py
+
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.schemas.client import ClientIdentity
+
+
+class ClientAuthCache:
+    """
+    Short-TTL LRU cache of verified client credentials.
+
+    Entries are keyed by client_id and hold a SHA-256 digest of the API key that
+    was verified against the database, never the key itself. Invalidation is
+    process-local; other workers converge within the TTL.
+
+    Every invalidation bumps a per-client version; a lookup that started before
+    an invalidation is not stored, so a slow authentication can't cache a key
+    that was rotated or a client that was deactivated meanwhile.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, ClientIdentity, float]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(api_key: str) -> bytes:
+        return hashlib.sha256(api_key.encode()).digest()
+
+    def get(self, client_id: str, api_key: str) -> Optional[ClientIdentity]:
+        entry = self._entries.get(client_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        digest, identity, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[client_id]
+            self.misses += 1
+            return None
+        if not hmac.compare_digest(digest, self._digest(api_key)):
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(client_id)
+        self.hits += 1
+        return identity
+
+    def version(self, client_id: str) -> int:
+        return self._versions.get(client_id, 0)
+
+    def put(self, client_id: str, api_key: str, identity: ClientIdentity, version: int) -> None:
+        if version != self.version(client_id):
+            return
+
+        self._entries[client_id] = (
+            self._digest(api_key),
+            identity,
+            time.monotonic() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(client_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, client_id: str) -> None:
+        self._versions[client_id] = self.version(client_id) + 1
+        self._entries.pop(client_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+client_auth_cache = ClientAuthCache(
+    ttl_seconds=settings.CLIENT_AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.CLIENT_AUTH_CACHE_MAX_ENTRIES,
+)
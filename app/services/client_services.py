@@ -2,14 +2,16 @@
 
 import secrets
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from fastapi import HTTPException, status
 
+from app.db.pagination import fetch_keyset_page
 from app.models.client import Client
 from app.schemas.client import ClientCreate, ClientUpdate
+from app.services.client_auth_cache import client_auth_cache
 
 
 class ClientService:
@@ -109,28 +111,26 @@ class ClientService:
         if client.api_key != api_key:
             return None
         
-        # Update last accessed time
-        client.last_accessed = datetime.utcnow()
-        await db.commit()
-        
+        # last_accessed is recorded by the caller via last_access_recorder (write-behind)
         return client
     
     @staticmethod
     async def get_all_clients(
         db: AsyncSession, 
-        skip: int = 0, 
         limit: int = 100,
-        include_inactive: bool = False
-    ) -> List[Client]:
-        """Get all clients with pagination"""
+        include_inactive: bool = False,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Client], Optional[str]]:
+        """Get clients ordered by creation time with keyset pagination"""
         query = select(Client).filter(Client.is_deleted == False)
         
         if not include_inactive:
             query = query.filter(Client.is_active == True)
         
-        query = query.offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await fetch_keyset_page(
+            db, query, Client.created_at, Client.id, limit, cursor,
+            parse_sort_value=datetime.fromisoformat,
+        )
     
     @staticmethod
     async def update_client(
@@ -151,6 +151,7 @@ class ClientService:
         
         await db.commit()
         await db.refresh(client)
+        client_auth_cache.invalidate(client.client_id)
         
         return client
     
@@ -167,6 +168,7 @@ class ClientService:
         
         await db.commit()
         await db.refresh(client)
+        client_auth_cache.invalidate(client.client_id)
         
         return client
     
@@ -183,5 +185,6 @@ class ClientService:
         
         await db.commit()
         await db.refresh(client)
+        client_auth_cache.invalidate(client.client_id)
         
         return client
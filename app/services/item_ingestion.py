@@ -0,0 +1,253 @@
+# app/services/item_ingestion.py
+
+import csv
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
+
+import asyncpg
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.db.session import engine
+from app.repositories.item import format_validation_error
+from app.schemas.item import IngestRejectedRow, ItemIngestReport, ItemIngestRow
+
+logger = logging.getLogger(__name__)
+
+# A parsed record, or the reason it could not be parsed, with its line number.
+ParsedRecord = Tuple[int, Union[Dict[str, Any], str]]
+
+STAGING_TABLE = "item_ingest_staging"
+STAGING_COLUMNS = ("seq", "id", "name", "description", "quantity", "item_type", "item_metadata")
+
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    seq bigint NOT NULL,
+    id uuid NOT NULL,
+    name text NOT NULL,
+    description text,
+    quantity integer,
+    item_type text NOT NULL,
+    item_metadata text
+) ON COMMIT DROP
+"""
+
+# One set-based upsert from staging. If an id appears more than once in the
+# load, the last row wins. (xmax = 0) is true for freshly inserted rows.
+MERGE_SQL = f"""
+WITH merged AS (
+    INSERT INTO items (id, name, description, quantity, item_type, item_metadata, created_at, updated_at)
+    SELECT DISTINCT ON (id)
+        id, name, description, quantity, item_type::item_type, item_metadata::jsonb, $1, $1
+    FROM {STAGING_TABLE}
+    ORDER BY id, seq DESC
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        quantity = EXCLUDED.quantity,
+        item_type = EXCLUDED.item_type,
+        item_metadata = EXCLUDED.item_metadata,
+        updated_at = EXCLUDED.updated_at
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted) AS inserted, count(*) FILTER (WHERE NOT inserted) AS updated
+FROM merged
+"""
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into decoded lines without buffering the whole body."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8").rstrip("\r")
+
+
+async def parse_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRecord]:
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, "Expected a JSON object"
+            continue
+        yield line_no, record
+
+
+# Quote states of csv's default dialect, for finding where a record ends.
+_FIELD_START, _UNQUOTED, _QUOTED, _QUOTE_IN_QUOTED = range(4)
+
+
+def _ends_in_quoted_field(line: str, quoted: bool = False) -> bool:
+    """
+    Whether `line` ends inside a quoted field (`quoted`: it starts inside one).
+    As in the csv module, a quote only opens a quoted field at the start of a
+    field, and "" inside one is an escaped quote; other quotes are literal.
+    """
+    if not quoted and '"' not in line:
+        return False
+    state = _QUOTED if quoted else _FIELD_START
+    for char in line:
+        if state == _QUOTED:
+            if char == '"':
+                state = _QUOTE_IN_QUOTED
+        elif char == ",":
+            state = _FIELD_START
+        elif state == _FIELD_START:
+            state = _QUOTED if char == '"' else _UNQUOTED
+        elif state == _QUOTE_IN_QUOTED:
+            state = _QUOTED if char == '"' else _UNQUOTED
+    return state == _QUOTED
+
+
+async def parse_csv(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRecord]:
+    """
+    Parse CSV with a header row. Empty cells are treated as missing, and
+    `item_metadata` holds a JSON object. Quoted fields may span lines.
+    """
+    header: Optional[List[str]] = None
+    line_no = 0
+    pending: List[str] = []
+    start = 0
+    async for line in lines:
+        line_no += 1
+        if not pending:
+            start = line_no
+        if _ends_in_quoted_field(line, quoted=bool(pending)):
+            pending.append(line)
+            continue  # the quoted field continues on the next line
+        pending.append(line)
+        text = "\n".join(pending)
+        pending = []
+        if not text.strip():
+            continue
+
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as e:
+            yield start, f"Invalid CSV: {e}"
+            continue
+        if header is None:
+            header = [column.strip() for column in values]
+            continue
+        if len(values) != len(header):
+            yield start, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+
+        record: Dict[str, Any] = {column: value for column, value in zip(header, values) if value != ""}
+        if "item_metadata" in record:
+            try:
+                record["item_metadata"] = json.loads(record["item_metadata"])
+            except ValueError as e:
+                yield start, f"item_metadata: invalid JSON: {e}"
+                continue
+        yield start, record
+
+    if pending:
+        yield start, "Invalid CSV: unterminated quoted field"
+
+
+PARSERS = {"csv": parse_csv, "ndjson": parse_ndjson}
+
+
+class ItemIngestionService:
+    @staticmethod
+    async def ingest(
+        chunks: AsyncIterable[bytes],
+        fmt: str,
+        batch_size: Optional[int] = None,
+    ) -> ItemIngestReport:
+        """
+        Load a CSV or NDJSON stream into `items`.
+
+        Records are validated against ItemCreate as they arrive and written to a
+        temporary staging table with COPY, `batch_size` rows at a time. The
+        staging table is then merged into `items` with one INSERT ... SELECT ...
+        ON CONFLICT, so the load is a single transaction. Invalid rows are
+        skipped and reported.
+        """
+        batch_size = batch_size or settings.INGEST_BATCH_SIZE
+        records = PARSERS[fmt](iter_lines(chunks))
+        started = time.perf_counter()
+        received = 0
+        rejected = 0
+        rejected_rows: List[IngestRejectedRow] = []
+
+        def reject(line: int, error: str) -> None:
+            nonlocal rejected
+            rejected += 1
+            if len(rejected_rows) < settings.INGEST_MAX_REPORTED_ERRORS:
+                rejected_rows.append(IngestRejectedRow(line=line, error=error))
+
+        async with engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            pg: asyncpg.Connection = raw_connection.driver_connection
+            try:
+                async with pg.transaction():
+                    await pg.execute(CREATE_STAGING_SQL)
+                    batch: List[tuple] = []
+                    async for line, record in records:
+                        received += 1
+                        if isinstance(record, str):
+                            reject(line, record)
+                            continue
+                        try:
+                            row = ItemIngestRow.model_validate(record)
+                        except ValidationError as e:
+                            reject(line, format_validation_error(e))
+                            continue
+                        batch.append((
+                            received,
+                            row.id or uuid4(),
+                            row.name,
+                            row.description,
+                            row.quantity,
+                            row.item_type.name,  # the item_type enum stores member names
+                            json.dumps(row.item_metadata) if row.item_metadata is not None else None,
+                        ))
+                        if len(batch) >= batch_size:
+                            await pg.copy_records_to_table(STAGING_TABLE, records=batch, columns=STAGING_COLUMNS)
+                            batch = []
+                    if batch:
+                        await pg.copy_records_to_table(STAGING_TABLE, records=batch, columns=STAGING_COLUMNS)
+
+                    merged = await pg.fetchrow(MERGE_SQL, datetime.utcnow())
+            except (asyncpg.PostgresError, ValueError) as e:
+                # ValueError covers undecodable input and values asyncpg can't encode.
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Ingestion aborted, nothing was loaded: {e}",
+                )
+
+        elapsed = time.perf_counter() - started
+        loaded = merged["inserted"] + merged["updated"]
+        report = ItemIngestReport(
+            received=received,
+            loaded=loaded,
+            inserted=merged["inserted"],
+            updated=merged["updated"],
+            rejected=rejected,
+            rejected_rows=rejected_rows,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(loaded / elapsed, 1) if elapsed else 0.0,
+        )
+        logger.info(
+            "Ingested %d items (%d inserted, %d updated, %d rejected) in %.2fs, %.0f rows/s",
+            loaded, report.inserted, report.updated, rejected, elapsed, report.rows_per_second,
+        )
+        return report
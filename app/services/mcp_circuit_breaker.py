@@ -0,0 +1,239 @@
+# app/services/mcp_circuit_breaker.py
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, Optional, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException
+from mcp.shared.exceptions import McpError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+MAX_TRACKED_OPERATIONS = 100  # per server
+
+
+class LatencyWindow:
+    """The last `size` latencies of an operation, for percentile-based deadlines."""
+
+    def __init__(self, size: int):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def deadline(self, floor: float, ceiling: float) -> float:
+        """
+        MCP_TIMEOUT_MULTIPLIER x the MCP_TIMEOUT_PERCENTILE latency, within
+        [floor, ceiling]. Until MCP_TIMEOUT_MIN_SAMPLES are seen, the ceiling.
+        """
+        if len(self._samples) < settings.MCP_TIMEOUT_MIN_SAMPLES:
+            return ceiling
+        observed = self.percentile(settings.MCP_TIMEOUT_PERCENTILE) * settings.MCP_TIMEOUT_MULTIPLIER
+        return min(ceiling, max(floor, observed))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker and adaptive deadlines for one MCP server.
+
+    closed: requests flow; MCP_BREAKER_FAILURE_THRESHOLD consecutive failures
+    (connect errors, transport errors, deadline overruns) open the circuit.
+    open: requests fail with 503 without touching the server until
+    MCP_BREAKER_OPEN_SECONDS have passed.
+    half_open: one trial request is let through; success closes the circuit,
+    failure (including failing to connect) opens it again.
+
+    Outcomes of requests that finish while the circuit is open (they were sent
+    before it opened) are ignored: only a half-open trial may close it.
+
+    Errors reported by the server itself (JSON-RPC errors, tool errors) show
+    that it is responsive and count as successes. Deadlines are per operation
+    but the failure count is per server: a tool that keeps overrunning its
+    deadline opens the circuit for every tool of the server, unless calls
+    that succeed in between keep resetting the count.
+    """
+
+    def __init__(self, server_id: UUID):
+        self.server_id = server_id
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self.connect_latency = LatencyWindow(settings.MCP_LATENCY_WINDOW)
+        self.call_latency: Dict[str, LatencyWindow] = {}
+
+    @property
+    def retry_after(self) -> float:
+        if self.state != OPEN or self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + settings.MCP_BREAKER_OPEN_SECONDS - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Raise 503 unless a request may be sent to the server now. Returns True
+        if the caller holds the half-open trial slot and must release() it.
+        """
+        if self.state == OPEN and self.retry_after == 0:
+            self.state = HALF_OPEN
+        if self.state == CLOSED:
+            return False
+        if self.state == HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self.rejected += 1
+        raise HTTPException(
+            status_code=503,
+            detail=f"MCP Server circuit is open after repeated failures ({self.last_error}).",
+            headers={"Retry-After": str(max(1, round(self.retry_after)))},
+        )
+
+    def release(self) -> None:
+        """Give back the half-open trial slot if the trial ended without an outcome."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        if self.state == OPEN:
+            return
+        if self.state == HALF_OPEN:
+            logger.info("Circuit for MCP server %s closed", self.server_id)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self, error: str) -> None:
+        if self.state == OPEN:
+            return
+        self.consecutive_failures += 1
+        self.last_error = error
+        self._trial_in_flight = False
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.consecutive_failures >= settings.MCP_BREAKER_FAILURE_THRESHOLD
+        ):
+            logger.warning("Circuit for MCP server %s opened: %s", self.server_id, error)
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+
+    def connect_timeout(self) -> float:
+        return self.connect_latency.deadline(
+            settings.MCP_CONNECT_TIMEOUT_MIN_SECONDS, settings.MCP_CONNECT_TIMEOUT_SECONDS
+        )
+
+    def record_connect(self, seconds: Optional[float], error: Optional[str] = None) -> None:
+        """
+        Outcome of opening a session: its duration, or None and the error. A
+        handshake alone doesn't close a half-open circuit; the trial request does.
+        """
+        if seconds is None:
+            self.record_failure(error or "connect failed")
+            return
+        self.connect_latency.observe(seconds)
+        if self.state == CLOSED:
+            self.record_success()
+
+    def _window(self, operation: str) -> LatencyWindow:
+        window = self.call_latency.get(operation)
+        if window is None:
+            if len(self.call_latency) >= MAX_TRACKED_OPERATIONS:
+                operation = "<other>"
+            window = self.call_latency.setdefault(operation, LatencyWindow(settings.MCP_LATENCY_WINDOW))
+        return window
+
+    def call_timeout(self, operation: str) -> float:
+        return self._window(operation).deadline(
+            settings.MCP_CALL_TIMEOUT_MIN_SECONDS, settings.MCP_CALL_TIMEOUT_MAX_SECONDS
+        )
+
+    async def call(self, operation: str, request: Awaitable[T]) -> T:
+        """Await an MCP request under the operation's deadline, recording the outcome."""
+        timeout = self.call_timeout(operation)
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(request, timeout=timeout)
+        except asyncio.TimeoutError:
+            self.record_failure(f"{operation} timed out after {timeout:.2f}s")
+            raise HTTPException(status_code=504, detail=f"MCP Server did not answer within {timeout:.2f}s.")
+        except McpError:
+            self.record_success()
+            raise
+        except Exception as e:
+            self.record_failure(f"{operation}: {str(e) or type(e).__name__}")
+            raise
+        self._window(operation).observe(time.monotonic() - started)
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after_seconds": round(self.retry_after, 1),
+            "last_error": self.last_error,
+            "connect_timeout_seconds": round(self.connect_timeout(), 3),
+            "call_timeouts_seconds": {
+                operation: round(self.call_timeout(operation), 3) for operation in sorted(self.call_latency)
+            },
+        }
+
+
+class GuardedSession:
+    """A pooled ClientSession whose requests go through the server's circuit breaker."""
+
+    def __init__(self, session, breaker: CircuitBreaker):
+        self.session = session
+        self.breaker = breaker
+
+    async def list_tools(self):
+        return await self.breaker.call("tools/list", self.session.list_tools())
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None):
+        return await self.breaker.call(name, self.session.call_tool(name, arguments))
+
+
+class CircuitBreakerRegistry:
+    def __init__(self):
+        self._breakers: Dict[UUID, CircuitBreaker] = {}
+
+    def get(self, server_id: UUID) -> CircuitBreaker:
+        breaker = self._breakers.get(server_id)
+        if breaker is None:
+            breaker = self._breakers[server_id] = CircuitBreaker(server_id)
+        return breaker
+
+    def is_open(self, server_id: UUID) -> bool:
+        breaker = self._breakers.get(server_id)
+        return breaker is not None and breaker.state != CLOSED
+
+    def discard(self, server_id: UUID) -> None:
+        self._breakers.pop(server_id, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {str(server_id): breaker.snapshot() for server_id, breaker in self._breakers.items()}
+
+
+circuit_breakers = CircuitBreakerRegistry()
@@ -1,91 +1,360 @@
 # app/services/mcp_client_services.py
 
+import asyncio
+import time
+import orjson
+from contextlib import asynccontextmanager
 from uuid import UUID
-from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.services.mcp_server_services import MCPServerService
-from typing import Dict, Any, List, Optional
-from contextlib import AsyncExitStack
-from mcp import ClientSession
-from mcp.client.sse import sse_client
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.services.mcp_circuit_breaker import GuardedSession, circuit_breakers
+from app.services.mcp_health import health_monitor
+from app.services.mcp_result_cache import CachePolicy, tool_cache_config, tool_result_cache
+from app.services.mcp_server_registry import RegisteredServer, mcp_server_registry
+from app.services.mcp_session_pool import _root_cause, mcp_session_pool
+from app.services.mcp_tool_cache import ToolCatalog, tool_catalog_cache
+from app.services.single_flight import canonical_json, mcp_single_flight
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+
+# (position in the batch, tool name, parameters)
+BatchCall = Tuple[int, str, Dict[str, Any]]
+
+# MCPServer.metadata_ key listing the tools whose identical concurrent calls
+# may share one upstream call (read-only tools only); "*" opts in every tool.
+COALESCE_TOOLS_KEY = "coalesce_tools"
+
+
+def _coalesces(server: RegisteredServer, tool_name: str) -> bool:
+    tools = (server.metadata_ or {}).get(COALESCE_TOOLS_KEY)
+    if tools == "*":
+        return True
+    return isinstance(tools, list) and tool_name in tools
+
+
+def _call_result(index: int, server_id: UUID, tool_name: str, started: float, **fields: Any) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "server_id": server_id,
+        "tool_name": tool_name,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        "result": None,
+        "error": None,
+        **fields,
+    }
+
+
+def _check_batch_size(calls: List[Any]) -> None:
+    if len(calls) > settings.MCP_BATCH_MAX_CALLS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A batch may contain at most {settings.MCP_BATCH_MAX_CALLS} calls",
+        )
+
+
+def _batch_response(results: List[Dict[str, Any]], started: float) -> Dict[str, Any]:
+    results.sort(key=lambda result: result["index"])
+    succeeded = sum(1 for result in results if result["status"] == "ok")
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
 
 class MCPClientService:
     @staticmethod
-    async def _create_session(server_url: str, api_key: Optional[str], stack: AsyncExitStack):
+    async def _get_enabled_server(server_id: UUID) -> RegisteredServer:
+        """
+        Resolve a server from the in-memory registry. No database connection
+        is held while the caller talks to the MCP server.
+        """
+        server = await mcp_server_registry.get(server_id)
+        if server is None:
+            raise HTTPException(status_code=404, detail="MCP Server not found or is disabled.")
+        return server
+
+    @staticmethod
+    @asynccontextmanager
+    async def _session(server: RegisteredServer) -> AsyncIterator[GuardedSession]:
+        """
+        Borrow a pooled session whose requests run under the server's circuit
+        breaker and adaptive deadlines. Fails fast with 503, without contacting
+        the server, if it is known to be down or its circuit is open.
+        """
+        health_monitor.check_available(server)
+        breaker = circuit_breakers.get(server.id)
+        trial = breaker.allow()
         try:
-            headers = {}
-            if api_key:
-                headers["Authorization"] = f"Bearer {api_key}"
-            
-            transport = await stack.enter_async_context(sse_client(server_url, headers=headers))
-            read, write = transport
-            session = await stack.enter_async_context(ClientSession(read, write))
-            await session.initialize()
-            return session
-        except Exception as e:
-            raise HTTPException(status_code=503, detail=f"Error connecting to MCP Server: {e}")
+            async with mcp_session_pool.session(
+                server, connect_timeout=breaker.connect_timeout(), on_connect=breaker.record_connect
+            ) as session:
+                yield GuardedSession(session, breaker)
+        finally:
+            if trial:
+                breaker.release()
 
     @staticmethod
-    async def list_tools(db: AsyncSession, server_id: UUID) -> List[Dict[str, Any]]:
+    async def _get_catalog(server: RegisteredServer, refresh: bool = False) -> ToolCatalog:
+        if not refresh:
+            catalog = tool_catalog_cache.get(server.id)
+            if catalog is not None:
+                return catalog
+
+        # Concurrent misses for the same server share one tools/list request.
+        return await mcp_single_flight.do(("tools/list", server.id), lambda: MCPClientService._fetch_catalog(server))
+
+    @staticmethod
+    async def _fetch_catalog(server: RegisteredServer) -> ToolCatalog:
+        version = tool_catalog_cache.version(server.id)
+        async with MCPClientService._session(server) as session:
+            response = await session.list_tools()
+        return tool_catalog_cache.put(server.id, [tool.model_dump(mode="json") for tool in response.tools], version)
+
+    @staticmethod
+    async def list_tools(server_id: UUID, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Retrieves the list of available tools from a specific MCP server.
+        Served from the tool catalog cache unless `refresh` is set.
         """
-        server = await MCPServerService.get_server(db, server_id)
-        if not server or not server.is_enabled:
-            raise HTTPException(status_code=404, detail="MCP Server not found or is disabled.")
+        server = await MCPClientService._get_enabled_server(server_id)
+        catalog = await MCPClientService._get_catalog(server, refresh=refresh)
+        return catalog.as_list()
 
-        async with AsyncExitStack() as stack:
-            session = await MCPClientService._create_session(str(server.server_url), server.api_key, stack)
-            response = await session.list_tools()
-            return [tool.model_dump() for tool in response.tools]
+    @staticmethod
+    async def list_tools_json(server_id: UUID, refresh: bool = False) -> bytes:
+        """Same as list_tools, as a JSON array serialized once per cached catalog."""
+        server = await MCPClientService._get_enabled_server(server_id)
+        catalog = await MCPClientService._get_catalog(server, refresh=refresh)
+        return catalog.as_json()
+
+    @staticmethod
+    async def _discover_server(server: RegisteredServer, semaphore: asyncio.Semaphore, refresh: bool) -> Dict[str, Any]:
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"server_id": server.id, "server_name": server.name, "cached": False, "tools": []}
+        try:
+            catalog = None if refresh else tool_catalog_cache.get(server.id)
+            if catalog is not None:
+                result.update(status="ok", cached=True, tools=catalog.as_list())
+            else:
+                # The deadline starts once a slot is free, so queued servers aren't penalized.
+                async with semaphore:
+                    catalog = await asyncio.wait_for(
+                        MCPClientService._get_catalog(server, refresh=True),
+                        timeout=settings.MCP_DISCOVERY_TIMEOUT_SECONDS,
+                    )
+                result.update(status="ok", tools=catalog.as_list())
+        except asyncio.TimeoutError:
+            result.update(status="timeout", error=f"No response within {settings.MCP_DISCOVERY_TIMEOUT_SECONDS}s")
+        except HTTPException as e:
+            result.update(status="error", error=str(e.detail))
+        except Exception as e:
+            result.update(status="error", error=str(e) or type(e).__name__)
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
 
     @staticmethod
-    async def get_tool(db: AsyncSession, server_id: UUID, tool_name: str) -> Dict[str, Any]:
+    async def discover_all_tools(refresh: bool = False) -> Dict[str, Any]:
         """
-        Retrieves the details of a specific tool from an MCP server.
+        Collect the tool catalogs of all enabled MCP servers concurrently.
+
+        At most MCP_DISCOVERY_CONCURRENCY servers are queried at once, each with
+        a MCP_DISCOVERY_TIMEOUT_SECONDS deadline. Cached catalogs are served
+        without contacting the server. A slow or failing server only affects
+        its own entry, which reports its status and error.
         """
-        server = await MCPServerService.get_server(db, server_id)
-        if not server or not server.is_enabled:
-            raise HTTPException(status_code=404, detail="MCP Server not found or is disabled.")
+        started = time.perf_counter()
+        servers = await mcp_server_registry.list_enabled()
+        semaphore = asyncio.Semaphore(settings.MCP_DISCOVERY_CONCURRENCY)
+        results = await asyncio.gather(
+            *(MCPClientService._discover_server(server, semaphore, refresh) for server in servers)
+        )
+        succeeded = sum(1 for result in results if result["status"] == "ok")
+        return {
+            "servers": results,
+            "total_tools": sum(len(result["tools"]) for result in results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
 
-        async with AsyncExitStack() as stack:
-            session = await MCPClientService._create_session(str(server.server_url), server.api_key, stack)
-            response = await session.list_tools()
-            for tool in response.tools:
-                if tool.name == tool_name:
-                    return tool.model_dump()
+    @staticmethod
+    async def get_tool(server_id: UUID, tool_name: str) -> Dict[str, Any]:
+        """
+        Retrieves the details of a specific tool from an MCP server.
+        """
+        server = await MCPClientService._get_enabled_server(server_id)
+        catalog = await MCPClientService._get_catalog(server)
+        tool = catalog.tools.get(tool_name)
+        if tool is None:
             raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found on MCP Server.")
+        return tool
 
     @staticmethod
-    async def execute_tool(db: AsyncSession, server_id: UUID, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_tool(
+        server_id: UUID, tool_name: str, parameters: Dict[str, Any], cache_policy: Optional[CachePolicy] = None
+    ) -> Tuple[bytes, Dict[str, str]]:
         """
         Executes a specific tool on an MCP server with the given parameters.
+        Returns the CallToolResult as JSON and the response headers to send.
+
+        Tools listed in the server's metadata_["cache_tools"] have their
+        successful results cached per arguments; `cache_policy` (from the
+        request's Cache-Control) can bypass or bound the cache. X-Cache reports
+        HIT, MISS or BYPASS for those tools. For tools listed in
+        metadata_["coalesce_tools"], concurrent calls with the same arguments
+        share one upstream call.
         """
-        server = await MCPServerService.get_server(db, server_id)
-        if not server or not server.is_enabled:
-            raise HTTPException(status_code=404, detail="MCP Server not found or is disabled.")
+        server = await MCPClientService._get_enabled_server(server_id)
+        cache_policy = cache_policy or CachePolicy()
+        cache_config = tool_cache_config(server.metadata_, tool_name)
+        coalesce = _coalesces(server, tool_name)
+        arguments = canonical_json(parameters) if cache_config or coalesce else None
+
+        headers: Dict[str, str] = {}
+        cacheable = cache_config is not None and arguments is not None
+        if cacheable:
+            key = (server.id, tool_name, arguments)
+            if cache_policy.no_cache or cache_policy.no_store:
+                tool_result_cache.bypasses += 1
+                headers["X-Cache"] = "BYPASS"
+            else:
+                cached = tool_result_cache.get(key, max_age=cache_policy.max_age)
+                if cached is not None:
+                    return cached.body, {"X-Cache": "HIT", "Age": str(int(cached.age))}
+                headers["X-Cache"] = "MISS"
+            version = tool_result_cache.version(server.id)
+
+        if coalesce and arguments is not None:
+            body, is_error = await mcp_single_flight.do(
+                ("tools/call", server.id, tool_name, arguments),
+                lambda: MCPClientService._call_tool(server, tool_name, parameters),
+            )
+        else:
+            body, is_error = await MCPClientService._call_tool(server, tool_name, parameters)
 
-        async with AsyncExitStack() as stack:
-            session = await MCPClientService._create_session(str(server.server_url), server.api_key, stack)
+        if cacheable and not is_error and not cache_policy.no_store:
+            tool_result_cache.put(key, body, cache_config, version)
+        return body, headers
+
+    @staticmethod
+    async def _call_tool(server: RegisteredServer, tool_name: str, parameters: Dict[str, Any]) -> Tuple[bytes, bool]:
+        """Call the tool upstream; returns the result as JSON and whether it is a tool error."""
+        async with MCPClientService._session(server) as session:
             result = await session.call_tool(tool_name, parameters)
-            return result.content
+        return orjson.dumps(result.model_dump(mode="json")), bool(result.isError)
+
+    @staticmethod
+    async def _call_in_batch(
+        session, server_id: UUID, call: BatchCall, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        index, tool_name, parameters = call
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await session.call_tool(tool_name, parameters)
+            except Exception as e:
+                return _call_result(index, server_id, tool_name, started, status="error", error=str(e) or type(e).__name__)
+        if result.isError:
+            return _call_result(
+                index, server_id, tool_name, started,
+                status="error", result=result.model_dump(mode="json"), error="Tool returned an error",
+            )
+        return _call_result(index, server_id, tool_name, started, status="ok", result=result.model_dump(mode="json"))
 
     @staticmethod
-    async def reload_server(db: AsyncSession, server_id: UUID) -> Dict[str, Any]:
+    async def _execute_batch_on_server(
+        server: RegisteredServer, calls: List[BatchCall], semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Run `calls` concurrently over one pooled session; MCP multiplexes requests on it."""
+        started = time.perf_counter()
+        try:
+            async with MCPClientService._session(server) as session:
+                return list(await asyncio.gather(
+                    *(MCPClientService._call_in_batch(session, server.id, call, semaphore) for call in calls)
+                ))
+        except HTTPException as e:
+            error = str(e.detail)
+        except Exception as e:
+            # e.g. the session broke; report it per call so other servers' results survive.
+            error = str(_root_cause(e)) or type(e).__name__
+        return [
+            _call_result(index, server.id, tool_name, started, status="error", error=error)
+            for index, tool_name, _ in calls
+        ]
+
+    @staticmethod
+    async def batch_execute(
+        server_id: UUID, calls: List[Tuple[str, Dict[str, Any]]], parallelism: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        Sends a reload command to a specific MCP server.
+        Execute independent tool calls on one MCP server concurrently, at most
+        `parallelism` at a time. Results keep the order of `calls`; a failing
+        call is reported in its own entry and doesn't affect the others.
         """
-        server = await MCPServerService.get_server(db, server_id)
-        if not server or not server.is_enabled:
-            raise HTTPException(status_code=404, detail="MCP Server not found or is disabled.")
+        _check_batch_size(calls)
+        started = time.perf_counter()
+        server = await MCPClientService._get_enabled_server(server_id)
+        semaphore = asyncio.Semaphore(parallelism or settings.MCP_BATCH_PARALLELISM)
+        batch = [(index, tool_name, parameters) for index, (tool_name, parameters) in enumerate(calls)]
+        results = await MCPClientService._execute_batch_on_server(server, batch, semaphore)
+        return _batch_response(results, started)
+
+    @staticmethod
+    async def batch_execute_across_servers(
+        calls: List[Tuple[UUID, str, Dict[str, Any]]], parallelism: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Like batch_execute, for calls spread over several servers. Each server
+        gets one session; `parallelism` bounds the calls in flight overall.
+        Calls to an unknown or disabled server fail individually.
+        """
+        _check_batch_size(calls)
+        started = time.perf_counter()
+        by_server: Dict[UUID, List[BatchCall]] = {}
+        for index, (server_id, tool_name, parameters) in enumerate(calls):
+            by_server.setdefault(server_id, []).append((index, tool_name, parameters))
 
-        async with AsyncExitStack() as stack:
-            session = await MCPClientService._create_session(str(server.server_url), server.api_key, stack)
+        servers = {server.id: server for server in await mcp_server_registry.list_enabled(list(by_server))}
 
+        semaphore = asyncio.Semaphore(parallelism or settings.MCP_BATCH_PARALLELISM)
+        results: List[Dict[str, Any]] = []
+        groups = []
+        for server_id, server_calls in by_server.items():
+            server = servers.get(server_id)
+            if server is None:
+                results.extend(
+                    _call_result(
+                        index, server_id, tool_name, started,
+                        status="error", latency_ms=0.0, error="MCP Server not found or is disabled.",
+                    )
+                    for index, tool_name, _ in server_calls
+                )
+                continue
+            groups.append(MCPClientService._execute_batch_on_server(server, server_calls, semaphore))
+
+        for group in await asyncio.gather(*groups):
+            results.extend(group)
+        return _batch_response(results, started)
+
+    @staticmethod
+    async def reload_server(server_id: UUID) -> Dict[str, Any]:
+        """
+        Sends a reload command to a specific MCP server.
+        """
+        server = await MCPClientService._get_enabled_server(server_id)
+
+        async with MCPClientService._session(server) as session:
             try:
                 await session.call_tool("reload", {})
-                return {"status": "Reload command sent successfully."}
             except Exception as e:
                 # This could fail if 'reload' tool doesn't exist.
                 raise HTTPException(status_code=501, detail=f"Could not reload server: {e}")
 
+        # The reload may change the advertised tools; refetch the catalog now.
+        tool_catalog_cache.invalidate(server.id)
+        tool_result_cache.invalidate(server.id)
+        try:
+            await MCPClientService._get_catalog(server, refresh=True)
+        except HTTPException:
+            pass
+        return {"status": "Reload command sent successfully."}
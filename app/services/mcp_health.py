@@ -0,0 +1,191 @@
+# app/services/mcp_health.py
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import String, Update, column, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from app.core.config import settings
+from app.db.session import transactional_session
+from app.models.mcp_server import MCPServer
+from app.services.mcp_circuit_breaker import circuit_breakers
+from app.services.mcp_server_registry import RegisteredServer, mcp_server_registry
+from app.services.mcp_session_pool import SessionPoolExhausted, _root_cause, mcp_session_pool
+
+logger = logging.getLogger(__name__)
+
+STATUS_UP = "UP"
+STATUS_DEGRADED = "DEGRADED"  # answers pings, but its circuit breaker is open
+STATUS_DOWN = "DOWN"
+
+
+class HealthMonitor:
+    """
+    Background prober for MCPServer.status and last_health_check.
+
+    Every `interval` seconds (randomized by +/- `jitter`) all enabled servers
+    are pinged concurrently through the session pool, so healthy servers keep
+    a warm session and a probe costs one round trip. Probe start times are
+    spread over the first `jitter` fraction of the interval. The results of a
+    sweep are written with a single UPDATE ... FROM (VALUES ...).
+
+    Servers found DOWN are remembered in memory so MCPClientService can
+    answer 503 immediately instead of waiting for a connect timeout. A server
+    that answers pings while its circuit breaker is open (its calls keep
+    failing or timing out) is recorded as DEGRADED.
+    """
+
+    def __init__(self, interval: float, jitter: float, timeout: float, concurrency: int):
+        self.interval = interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self._down: Dict[UUID, str] = {}  # server id -> last probe error
+        self._task: Optional[asyncio.Task] = None
+        self.sweeps = 0
+        self.last_sweep_ms: Optional[float] = None
+        self.last_sweep_at: Optional[datetime] = None
+
+    def is_down(self, server_id: UUID) -> bool:
+        return server_id in self._down
+
+    def check_available(self, server: RegisteredServer) -> None:
+        """Raise 503 if the last sweep found `server` down."""
+        error = self._down.get(server.id)
+        if error is not None:
+            raise HTTPException(
+                status_code=503,
+                detail=f"MCP Server is down (last health check: {error}).",
+                headers={"Retry-After": str(int(self.interval))},
+            )
+
+    def forget(self, server_id: UUID) -> None:
+        """Drop the known state of a server, e.g. after its URL or credentials changed."""
+        self._down.pop(server_id, None)
+
+    async def _probe(self, server: RegisteredServer, semaphore: asyncio.Semaphore) -> Optional[Tuple[str, Optional[str]]]:
+        """Returns (status, error), or None when the probe was skipped."""
+        await asyncio.sleep(random.uniform(0, self.interval * self.jitter))
+        async with semaphore:
+            if mcp_session_pool.saturated(server.id):
+                # Every session is busy with a call (checked after waiting for the
+                # semaphore, as calls may have taken them meanwhile); a ping would
+                # only queue behind them.
+                return None
+            try:
+                async with mcp_session_pool.session(
+                    server, connect_timeout=self.timeout, acquire_timeout=self.timeout
+                ) as session:
+                    async with asyncio.timeout(self.timeout):
+                        await session.send_ping()
+            except SessionPoolExhausted:
+                # Calls took the free sessions first; that says nothing about the server.
+                return None
+            except TimeoutError:
+                return STATUS_DOWN, f"no response within {self.timeout}s"
+            except HTTPException as e:
+                return STATUS_DOWN, str(e.detail)
+            except Exception as e:
+                return STATUS_DOWN, str(_root_cause(e)) or type(e).__name__
+        if circuit_breakers.is_open(server.id):
+            return STATUS_DEGRADED, None
+        return STATUS_UP, None
+
+    @staticmethod
+    def _build_update(results: List[Tuple[UUID, str]], checked_at: datetime) -> Update:
+        rows = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("status", String()),
+            name="v",
+        ).data(results)
+        return (
+            update(MCPServer)
+            .where(MCPServer.id == rows.c.id)
+            # Keep updated_at: a health check is not a change to the server's configuration.
+            .values(status=rows.c.status, last_health_check=checked_at, updated_at=MCPServer.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def sweep(self) -> Dict[UUID, str]:
+        """Probe all enabled servers once; returns the new status per probed server."""
+        started = time.perf_counter()
+        servers = await mcp_server_registry.list_enabled()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        outcomes = await asyncio.gather(*(self._probe(server, semaphore) for server in servers))
+
+        statuses: Dict[UUID, str] = {}
+        down: Dict[UUID, str] = {}
+        for server, outcome in zip(servers, outcomes):
+            if outcome is None:
+                if server.id in self._down:
+                    down[server.id] = self._down[server.id]
+                continue
+            statuses[server.id], error = outcome
+            if error is not None:
+                down[server.id] = error
+                if server.id not in self._down:
+                    logger.warning("MCP server %s is down: %s", server.name, error)
+            elif server.id in self._down:
+                logger.info("MCP server %s is up again", server.name)
+        self._down = down
+
+        checked_at = datetime.utcnow()
+        if statuses:
+            try:
+                async with transactional_session() as session:
+                    await session.execute(self._build_update(list(statuses.items()), checked_at))
+            except Exception:
+                logger.exception("Failed to record health of %d MCP servers", len(statuses))
+
+        self.sweeps += 1
+        self.last_sweep_at = checked_at
+        self.last_sweep_ms = round((time.perf_counter() - started) * 1000, 1)
+        return statuses
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("MCP health sweep failed")
+            await asyncio.sleep(self.interval * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._down = {}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "sweeps": self.sweeps,
+            "last_sweep_at": self.last_sweep_at.isoformat() if self.last_sweep_at else None,
+            "last_sweep_ms": self.last_sweep_ms,
+            "down": {str(server_id): error for server_id, error in self._down.items()},
+        }
+
+
+health_monitor = HealthMonitor(
+    interval=settings.MCP_HEALTH_CHECK_INTERVAL_SECONDS,
+    jitter=settings.MCP_HEALTH_CHECK_JITTER,
+    timeout=settings.MCP_HEALTH_CHECK_TIMEOUT_SECONDS,
+    concurrency=settings.MCP_HEALTH_CHECK_CONCURRENCY,
+)
+mcp_server_registry.add_change_listener(health_monitor.forget)
@@ -0,0 +1,169 @@
+# app/services/mcp_result_cache.py
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+
+# MCPServer.metadata_ key configuring cached tools:
+#   {"cache_tools": {"lookup": {"ttl": 300, "max_entry_bytes": 65536}, "*": {"ttl": 30}}}
+# "*" applies to tools not listed by name. Only pure lookups belong here.
+# A cached result is served to every client: the key doesn't include the
+# caller, so never cache tools whose result depends on who is asking.
+CACHE_TOOLS_KEY = "cache_tools"
+
+# (server id, tool name, canonical JSON of the arguments)
+ResultKey = Tuple[UUID, str, bytes]
+
+
+@dataclass(frozen=True)
+class ToolCacheConfig:
+    ttl_seconds: float
+    max_entry_bytes: int
+
+
+def tool_cache_config(metadata: Optional[Dict[str, Any]], tool_name: str) -> Optional[ToolCacheConfig]:
+    """The cache settings of `tool_name` from server metadata, or None if it isn't cached."""
+    tools = (metadata or {}).get(CACHE_TOOLS_KEY)
+    if not isinstance(tools, dict):
+        return None
+    config = tools.get(tool_name, tools.get("*"))
+    if not isinstance(config, dict):
+        return None
+    try:
+        ttl = float(config.get("ttl", 0))
+        max_entry_bytes = int(config.get("max_entry_bytes", settings.MCP_RESULT_CACHE_MAX_ENTRY_BYTES))
+    except (TypeError, ValueError):
+        return None
+    if ttl <= 0:
+        return None
+    return ToolCacheConfig(
+        ttl_seconds=ttl,
+        max_entry_bytes=min(max_entry_bytes, settings.MCP_RESULT_CACHE_MAX_ENTRY_BYTES),
+    )
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """The request's Cache-Control directives that apply to tool results."""
+    no_cache: bool = False  # don't serve from the cache, but store the fresh result
+    no_store: bool = False  # neither serve from nor store into the cache
+    max_age: Optional[float] = None  # only serve entries at most this old
+
+    @classmethod
+    def from_header(cls, header: Optional[str]) -> "CachePolicy":
+        no_cache = no_store = False
+        max_age = None
+        for directive in (header or "").lower().split(","):
+            name, _, value = directive.strip().partition("=")
+            if name == "no-cache":
+                no_cache = True
+            elif name == "no-store":
+                no_store = True
+            elif name == "max-age":
+                try:
+                    max_age = max(0.0, float(value.strip('"')))
+                except ValueError:
+                    pass
+        return cls(no_cache=no_cache, no_store=no_store, max_age=max_age)
+
+
+@dataclass
+class CachedResult:
+    body: bytes
+    stored_at: float
+    expires_at: float
+    size: int
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
+class ToolResultCache:
+    """
+    In-process cache of serialized tool results, bounded by total bytes (LRU).
+
+    Entries are keyed by (server, tool, canonical arguments), shared by all
+    clients, and expire after the tool's TTL. Results larger than the tool's
+    max_entry_bytes are not stored. As in ToolCatalogCache, invalidating a
+    server bumps its version so a call that started before the invalidation
+    is not stored.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[ResultKey, CachedResult]" = OrderedDict()
+        self._versions: Dict[UUID, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected_too_large = 0
+
+    def _remove(self, key: ResultKey) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+
+    def get(self, key: ResultKey, max_age: Optional[float] = None) -> Optional[CachedResult]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+        if entry is None or (max_age is not None and entry.age > max_age):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def version(self, server_id: UUID) -> int:
+        return self._versions.get(server_id, 0)
+
+    def put(self, key: ResultKey, body: bytes, config: ToolCacheConfig, version: int) -> bool:
+        server_id = key[0]
+        size = len(body) + len(key[1]) + len(key[2])
+        if size > config.max_entry_bytes:
+            self.rejected_too_large += 1
+            return False
+        if version != self.version(server_id):
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+        now = time.monotonic()
+        self._entries[key] = CachedResult(body=body, stored_at=now, expires_at=now + config.ttl_seconds, size=size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return True
+
+    def invalidate(self, server_id: UUID) -> None:
+        self._versions[server_id] = self.version(server_id) + 1
+        for key in [key for key in self._entries if key[0] == server_id]:
+            self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "rejected_too_large": self.rejected_too_large,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+tool_result_cache = ToolResultCache(max_bytes=settings.MCP_RESULT_CACHE_MAX_BYTES)
@@ -0,0 +1,254 @@
+# app/services/mcp_server_registry.py
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.models.mcp_server import MCPServer
+from app.services.mcp_circuit_breaker import circuit_breakers
+from app.services.mcp_result_cache import tool_result_cache
+from app.services.mcp_session_pool import mcp_session_pool
+from app.services.mcp_tool_cache import tool_catalog_cache
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "mcp_servers_changed"  # see migration d3f81a6c2e40
+
+
+@dataclass(frozen=True)
+class RegisteredServer:
+    """The fields of an enabled MCPServer the gateway needs to reach it."""
+    id: UUID
+    name: str
+    server_url: str
+    api_key: Optional[str]
+    transport_type: Optional[str]
+    is_enabled: bool
+    metadata_: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_row(cls, server: MCPServer) -> "RegisteredServer":
+        return cls(
+            # asyncpg returns its own UUID subclass, which orjson refuses to serialize.
+            id=UUID(bytes=server.id.bytes),
+            name=server.name,
+            server_url=server.server_url,
+            api_key=server.api_key,
+            transport_type=server.transport_type,
+            is_enabled=bool(server.is_enabled),
+            metadata_=server.metadata_,
+        )
+
+
+def _enabled_servers_query():
+    return select(MCPServer).filter(MCPServer.is_enabled == True, MCPServer.is_deleted == False)
+
+
+class MCPServerRegistry:
+    """
+    Process-local copy of the enabled MCP servers.
+
+    Loaded at startup and kept fresh through LISTEN on a dedicated asyncpg
+    connection: a trigger on mcp_servers NOTIFYs the changed id, and every
+    worker reloads that one row. Resolving a server on the request path is
+    then a dict lookup.
+
+    While the listener is not connected (startup failed, connection lost)
+    notifications could be missed, so lookups go to the database until it
+    is back and the registry has been reloaded in full.
+
+    Whenever a server's configuration changes or it goes away, its pooled
+    sessions, circuit breaker, cached catalog and cached tool results are
+    dropped, and the change listeners (e.g. the health monitor) are told.
+    """
+
+    def __init__(self, reconnect_seconds: float):
+        self.reconnect_seconds = reconnect_seconds
+        self._servers: Dict[UUID, RegisteredServer] = {}
+        self._ready = False
+        self._versions: Dict[UUID, int] = {}
+        self._connection: Optional[asyncpg.Connection] = None
+        self._lost = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._refreshes: Set[asyncio.Task] = set()
+        self._notified_while_loading: Set[UUID] = set()
+        self._change_listeners: List[Callable[[UUID], None]] = []
+        self.notifications = 0
+        self.fallback_lookups = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    async def get(self, server_id: UUID) -> Optional[RegisteredServer]:
+        """The enabled server with this id, or None."""
+        if self._ready:
+            return self._servers.get(server_id)
+        self.fallback_lookups += 1
+        async with SessionLocal() as db:
+            result = await db.execute(_enabled_servers_query().filter(MCPServer.id == server_id))
+            server = result.scalar_one_or_none()
+        return RegisteredServer.from_row(server) if server else None
+
+    async def list_enabled(self, server_ids: Optional[List[UUID]] = None) -> List[RegisteredServer]:
+        """Enabled servers ordered by name, optionally restricted to `server_ids`."""
+        if self._ready:
+            servers = self._servers.values()
+            if server_ids is not None:
+                wanted = set(server_ids)
+                servers = [server for server in servers if server.id in wanted]
+            return sorted(servers, key=lambda server: server.name)
+        self.fallback_lookups += 1
+        query = _enabled_servers_query()
+        if server_ids is not None:
+            query = query.filter(MCPServer.id.in_(server_ids))
+        async with SessionLocal() as db:
+            result = await db.execute(query.order_by(MCPServer.name))
+            return [RegisteredServer.from_row(server) for server in result.scalars().all()]
+
+    def apply(self, server: MCPServer) -> None:
+        """Record a row this process just wrote, ahead of its notification."""
+        self._versions[server.id] = self._versions.get(server.id, 0) + 1
+        previous = self._servers.get(server.id)
+        if server.is_enabled and not server.is_deleted:
+            self._servers[server.id] = RegisteredServer.from_row(server)
+        else:
+            self._servers.pop(server.id, None)
+        # While not ready the previous entry may be stale, so assume a change.
+        if not self._ready or previous != self._servers.get(server.id):
+            self._server_changed(server.id)
+
+    def add_change_listener(self, callback: Callable[[UUID], None]) -> None:
+        """Call `callback(server_id)` whenever a server changes or is removed."""
+        self._change_listeners.append(callback)
+
+    def _server_changed(self, server_id: UUID) -> None:
+        mcp_session_pool.discard(server_id)
+        circuit_breakers.discard(server_id)
+        tool_catalog_cache.invalidate(server_id)
+        tool_result_cache.invalidate(server_id)
+        for callback in self._change_listeners:
+            callback(server_id)
+
+    async def reload(self) -> None:
+        async with SessionLocal() as db:
+            result = await db.execute(_enabled_servers_query())
+            servers = {server.id: RegisteredServer.from_row(server) for server in result.scalars().all()}
+        previous, self._servers = self._servers, servers
+        # Changes made while the listener was down were never notified.
+        for server_id in previous.keys() | servers.keys():
+            if previous.get(server_id) != servers.get(server_id):
+                self._server_changed(server_id)
+
+    async def _refresh(self, server_id: UUID, version: int) -> None:
+        try:
+            async with SessionLocal() as db:
+                result = await db.execute(_enabled_servers_query().filter(MCPServer.id == server_id))
+                server = result.scalar_one_or_none()
+        except Exception:
+            logger.exception("Failed to reload MCP server %s; falling back to the database", server_id)
+            self._ready = False
+            self._lost.set()
+            return
+        if self._versions.get(server_id) != version:
+            return  # a newer change is being applied
+        previous = self._servers.get(server_id)
+        if server is None:
+            self._servers.pop(server_id, None)
+        else:
+            self._servers[server_id] = RegisteredServer.from_row(server)
+        if previous != self._servers.get(server_id):
+            self._server_changed(server_id)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            server_id = UUID(payload)
+        except ValueError:
+            return
+        self.notifications += 1
+        if not self._ready:
+            # A full reload is running and may have read the row before this change.
+            self._notified_while_loading.add(server_id)
+        self._schedule_refresh(server_id)
+
+    def _schedule_refresh(self, server_id: UUID) -> None:
+        version = self._versions[server_id] = self._versions.get(server_id, 0) + 1
+        task = asyncio.create_task(self._refresh(server_id, version))
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    def _on_terminate(self, connection) -> None:
+        logger.warning("MCP server registry listener disconnected; falling back to the database")
+        self._ready = False
+        self._lost.set()
+
+    async def _listen(self) -> None:
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        self._connection = await asyncpg.connect(dsn)
+        self._connection.add_termination_listener(self._on_terminate)
+        await self._connection.add_listener(CHANNEL, self._on_notify)
+        # Load after LISTEN so no change falls between the two.
+        self._notified_while_loading.clear()
+        await self.reload()
+        self._lost.clear()
+        self._ready = True
+        for server_id in self._notified_while_loading:
+            self._schedule_refresh(server_id)
+        self._notified_while_loading.clear()
+        logger.info("MCP server registry loaded %d servers", len(self._servers))
+
+    async def _close_connection(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            try:
+                await connection.close(timeout=5)
+            except Exception:
+                connection.terminate()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+                await self._lost.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("MCP server registry listener unavailable: %s", e)
+            self._ready = False
+            await self._close_connection()
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._ready = False
+        await self._close_connection()
+        for task in list(self._refreshes):
+            task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self._ready,
+            "servers": len(self._servers),
+            "notifications": self.notifications,
+            "fallback_lookups": self.fallback_lookups,
+        }
+
+
+mcp_server_registry = MCPServerRegistry(reconnect_seconds=settings.MCP_REGISTRY_RECONNECT_SECONDS)
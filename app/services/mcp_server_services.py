@@ -2,10 +2,13 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.db.metadata_filter import MetadataFilter
+from app.db.pagination import fetch_keyset_page
 from app.models.mcp_server import MCPServer
 from app.schemas.mcp_server import MCPServerCreate, MCPServerUpdate
+from app.services.mcp_server_registry import mcp_server_registry
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 class MCPServerService:
     @staticmethod
@@ -17,6 +20,7 @@ class MCPServerService:
         db.add(db_server)
         await db.commit()
         await db.refresh(db_server)
+        mcp_server_registry.apply(db_server)
         return db_server
 
     @staticmethod
@@ -30,9 +34,16 @@ class MCPServerService:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def get_all_servers(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[MCPServer]:
-        result = await db.execute(select(MCPServer).filter(MCPServer.is_deleted == False).offset(skip).limit(limit))
-        return result.scalars().all()
+    async def get_all_servers(
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        metadata_filter: Optional[MetadataFilter] = None,
+    ) -> Tuple[List[MCPServer], Optional[str]]:
+        query = select(MCPServer).filter(MCPServer.is_deleted == False)
+        if metadata_filter:
+            query = metadata_filter.apply(query, MCPServer.metadata_)
+        return await fetch_keyset_page(db, query, MCPServer.name, MCPServer.id, limit, cursor)
 
     @staticmethod
     async def update_server(db: AsyncSession, server_id: UUID, server_update: MCPServerUpdate) -> Optional[MCPServer]:
@@ -43,6 +54,7 @@ class MCPServerService:
                 setattr(db_server, key, value)
             await db.commit()
             await db.refresh(db_server)
+            mcp_server_registry.apply(db_server)
         return db_server
 
     @staticmethod
@@ -52,4 +64,5 @@ class MCPServerService:
             db_server.is_deleted = True
             await db.commit()
             await db.refresh(db_server)
+            mcp_server_registry.apply(db_server)
         return db_server
@@ -0,0 +1,274 @@
+# app/services/mcp_session_pool.py
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable, Deque, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.shared.exceptions import McpError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[UUID, str, Optional[str]]
+# Called with (handshake seconds, None) after a successful connect, or (None, error).
+ConnectObserver = Callable[[Optional[float], Optional[str]], None]
+
+
+class SessionPoolExhausted(HTTPException):
+    """No session of the server's pool became free in time."""
+
+    def __init__(self):
+        super().__init__(status_code=503, detail="MCP Server session pool exhausted.")
+
+
+def _root_cause(error: BaseException) -> BaseException:
+    # anyio task groups wrap transport failures in ExceptionGroups; report the first leaf.
+    while isinstance(error, BaseExceptionGroup) and error.exceptions:
+        error = error.exceptions[0]
+    return error
+
+
+class PooledSession:
+    """
+    An initialized MCP ClientSession kept open by a dedicated task.
+
+    The SSE transport and the ClientSession are anyio context managers that must be
+    entered and exited from the same task, so each connection lives in its own task
+    and is closed by signalling that task.
+    """
+
+    def __init__(self, server_url: str, headers: Dict[str, str]):
+        self.server_url = server_url
+        self.headers = headers
+        self.session: Optional[ClientSession] = None
+        self.last_used = time.monotonic()
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def start(self, timeout: Optional[float] = None) -> None:
+        """Connect and run the MCP handshake, raising if either fails."""
+        timeout = timeout or settings.MCP_CONNECT_TIMEOUT_SECONDS
+        self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            # The handshake never finished, so there is nothing to close gracefully.
+            self._task.cancel()
+            raise TimeoutError(f"no handshake within {timeout:.1f}s")
+        except asyncio.CancelledError:
+            # The caller gave up (e.g. a discovery deadline); don't leave the connect running.
+            self._task.cancel()
+            raise
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with sse_client(
+                self.server_url,
+                headers=self.headers,
+                timeout=settings.MCP_CONNECT_TIMEOUT_SECONDS,
+            ) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.info("MCP session to %s dropped: %s", self.server_url, e)
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is None or self._task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=5)
+        except (asyncio.TimeoutError, Exception):
+            self._task.cancel()
+
+
+class ServerSessionPool:
+    """
+    Bounded pool of warm sessions for a single MCP server.
+
+    At most `size` sessions are handed out at once; callers beyond that wait up to
+    MCP_SESSION_ACQUIRE_TIMEOUT_SECONDS. Idle sessions are reused until they die
+    or exceed MCP_SESSION_MAX_IDLE_SECONDS. Sessions are closed in the background
+    so a caller's deadline never includes the (up to 5s) close.
+    """
+
+    def __init__(self, key: PoolKey, size: int):
+        self.key = key
+        self.server_url = key[1]
+        self.headers = {"Authorization": f"Bearer {key[2]}"} if key[2] else {}
+        self._idle: Deque[PooledSession] = deque()
+        self._semaphore = asyncio.Semaphore(size)
+        self._closed = False
+        self._closing: Set[asyncio.Task] = set()
+
+    @property
+    def saturated(self) -> bool:
+        return self._semaphore.locked()
+
+    def _close_in_background(self, pooled: PooledSession) -> None:
+        task = asyncio.create_task(pooled.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _is_reusable(self, pooled: PooledSession) -> bool:
+        if not pooled.alive:
+            return False
+        return time.monotonic() - pooled.last_used < settings.MCP_SESSION_MAX_IDLE_SECONDS
+
+    async def _checkout(
+        self, connect_timeout: Optional[float] = None, on_connect: Optional[ConnectObserver] = None
+    ) -> PooledSession:
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._is_reusable(pooled):
+                return pooled
+            self._close_in_background(pooled)
+
+        pooled = PooledSession(self.server_url, self.headers)
+        started = time.monotonic()
+        try:
+            await pooled.start(connect_timeout)
+        except Exception as e:
+            error = str(_root_cause(e))
+            if on_connect is not None:
+                on_connect(None, error)
+            raise HTTPException(status_code=503, detail=f"Error connecting to MCP Server: {error}")
+        if on_connect is not None:
+            on_connect(time.monotonic() - started, None)
+        return pooled
+
+    def _checkin(self, pooled: PooledSession) -> None:
+        if self._closed or not pooled.alive:
+            self._close_in_background(pooled)
+            return
+        pooled.last_used = time.monotonic()
+        self._idle.append(pooled)
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        connect_timeout: Optional[float] = None,
+        on_connect: Optional[ConnectObserver] = None,
+        acquire_timeout: Optional[float] = None,
+    ) -> AsyncIterator[ClientSession]:
+        try:
+            await asyncio.wait_for(
+                self._semaphore.acquire(),
+                timeout=acquire_timeout or settings.MCP_SESSION_ACQUIRE_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            raise SessionPoolExhausted()
+
+        pooled: Optional[PooledSession] = None
+        try:
+            pooled = await self._checkout(connect_timeout, on_connect)
+            yield pooled.session
+        except BaseException as e:
+            # Protocol-level errors leave the stream intact; anything else may not.
+            if pooled is not None and not isinstance(e, (McpError, HTTPException)):
+                self._close_in_background(pooled)
+                pooled = None
+            raise
+        finally:
+            if pooled is not None:
+                self._checkin(pooled)
+            self._semaphore.release()
+
+    async def close(self) -> None:
+        self._closed = True
+        while self._idle:
+            await self._idle.pop().close()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+
+class MCPSessionPool:
+    """
+    Registry of per-server session pools, keyed by MCPServer.id.
+
+    A pool is rebuilt when the server's URL or api_key changes, so updated
+    credentials take effect on the next request.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._pools: Dict[UUID, ServerSessionPool] = {}
+        self._closing: Set[asyncio.Task] = set()
+
+    def _pool_for(self, server_id: UUID, server_url: str, api_key: Optional[str]) -> ServerSessionPool:
+        key = (server_id, server_url, api_key)
+        pool = self._pools.get(server_id)
+        if pool is None or pool.key != key:
+            if pool is not None:
+                self._close_in_background(pool)
+            pool = ServerSessionPool(key, self.size)
+            self._pools[server_id] = pool
+        return pool
+
+    def _close_in_background(self, pool: ServerSessionPool) -> None:
+        task = asyncio.create_task(pool.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def session(
+        self,
+        server,
+        connect_timeout: Optional[float] = None,
+        on_connect: Optional[ConnectObserver] = None,
+        acquire_timeout: Optional[float] = None,
+    ) -> AsyncContextManager[ClientSession]:
+        """
+        Borrow a warm session for `server` (an MCPServer row or equivalent).
+        Waits up to `acquire_timeout` (default MCP_SESSION_ACQUIRE_TIMEOUT_SECONDS)
+        for a free slot, then raises SessionPoolExhausted. If a new session must
+        be opened, its handshake gets `connect_timeout` (default
+        MCP_CONNECT_TIMEOUT_SECONDS) and its outcome is reported to `on_connect`.
+        """
+        pool = self._pool_for(server.id, str(server.server_url), server.api_key)
+        return pool.acquire(connect_timeout, on_connect, acquire_timeout)
+
+    def saturated(self, server_id: UUID) -> bool:
+        """True if every session of the server's pool is currently handed out."""
+        pool = self._pools.get(server_id)
+        return pool is not None and pool.saturated
+
+    def discard(self, server_id: UUID) -> None:
+        """Drop the pool for a server, e.g. after it was disabled or deleted."""
+        pool = self._pools.pop(server_id, None)
+        if pool is not None:
+            self._close_in_background(pool)
+
+    async def close(self) -> None:
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            await pool.close()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+
+mcp_session_pool = MCPSessionPool(size=settings.MCP_SESSION_POOL_SIZE)
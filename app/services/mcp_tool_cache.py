@@ -0,0 +1,98 @@
+# app/services/mcp_tool_cache.py
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import orjson
+
+from app.core.config import settings
+
+
+@dataclass
+class ToolCatalog:
+    """Tools advertised by one MCP server, keyed by tool name (in server order)."""
+    tools: Dict[str, Dict[str, Any]]
+    fetched_at: float
+    expires_at: float
+    _json: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        return list(self.tools.values())
+
+    def as_json(self) -> bytes:
+        """The tool list as a JSON array, serialized once per cached catalog."""
+        if self._json is None:
+            self._json = orjson.dumps(self.as_list())
+        return self._json
+
+
+class ToolCatalogCache:
+    """
+    In-process TTL cache of MCP tool catalogs, bounded by number of servers (LRU).
+
+    Every invalidation bumps a per-server version; a fetch that started before an
+    invalidation is not stored, so a slow list_tools can't resurrect stale data.
+    """
+
+    def __init__(self, ttl_seconds: float, max_servers: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_servers = max_servers
+        self._entries: "OrderedDict[UUID, ToolCatalog]" = OrderedDict()
+        self._versions: Dict[UUID, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, server_id: UUID) -> Optional[ToolCatalog]:
+        catalog = self._entries.get(server_id)
+        if catalog is None or catalog.expires_at <= time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(server_id)
+        self.hits += 1
+        return catalog
+
+    def version(self, server_id: UUID) -> int:
+        return self._versions.get(server_id, 0)
+
+    def put(self, server_id: UUID, tools: List[Dict[str, Any]], version: int) -> ToolCatalog:
+        now = time.monotonic()
+        catalog = ToolCatalog(
+            tools={tool["name"]: tool for tool in tools},
+            fetched_at=now,
+            expires_at=now + self.ttl_seconds,
+        )
+        if version != self.version(server_id):
+            return catalog
+
+        self._entries[server_id] = catalog
+        self._entries.move_to_end(server_id)
+        while len(self._entries) > self.max_servers:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return catalog
+
+    def invalidate(self, server_id: UUID) -> None:
+        self._versions[server_id] = self.version(server_id) + 1
+        self._entries.pop(server_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_servers": self.max_servers,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+tool_catalog_cache = ToolCatalogCache(
+    ttl_seconds=settings.TOOL_CACHE_TTL_SECONDS,
+    max_servers=settings.TOOL_CACHE_MAX_SERVERS,
+)
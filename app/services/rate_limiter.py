@@ -0,0 +1,281 @@
+# app/services/rate_limiter.py
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.rate_limit import parse_rate_limit
+from app.db.session import SessionLocal
+from app.models.rate_limit import RateLimitCounter
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(ABC):
+    """
+    Interface of a rate-limit backend.
+
+    `acquire` consumes `cost` requests (e.g. the calls of a batch) for `key`
+    under `spec` ("count/period"), all or nothing, and returns
+    (allowed, retry_after_seconds).
+    """
+
+    def __init__(self, default_spec: str):
+        self.default_spec = default_spec
+        self.allowed = 0
+        self.rejected = 0
+
+    def _limits(self, spec: Optional[str]) -> Tuple[int, float]:
+        try:
+            return parse_rate_limit(spec or self.default_spec)
+        except ValueError:
+            return parse_rate_limit(self.default_spec)
+
+    @abstractmethod
+    async def acquire(self, key: Any, spec: Optional[str], cost: int = 1) -> Tuple[bool, float]:
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self).__name__,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+        }
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: int, period: float, now: float):
+        self.capacity = capacity
+        self.rate = capacity / period  # tokens per second
+        self.tokens = float(capacity)
+        self.updated_at = now
+
+
+class TokenBucketLimiter(RateLimitBackend):
+    """
+    In-process token-bucket limiter keyed by client.
+
+    Each check is a dict lookup plus a few float operations. Buckets are rebuilt
+    when a client's spec changes; the spec string is parsed once (lru_cache).
+    Limits are per process: N workers together admit up to N times the limit.
+    """
+
+    def __init__(self, default_spec: str):
+        super().__init__(default_spec)
+        self._buckets: Dict[Any, Tuple[str, TokenBucket]] = {}
+
+    async def acquire(self, key: Any, spec: Optional[str], cost: int = 1) -> Tuple[bool, float]:
+        return self.check(key, spec, cost)
+
+    def check(self, key: Any, spec: Optional[str], cost: int = 1) -> Tuple[bool, float]:
+        """
+        Consume `cost` tokens for `key`, or none if fewer are available.
+
+        Returns (allowed, retry_after_seconds); retry_after is 0 when allowed.
+        """
+        now = time.monotonic()
+        entry = self._buckets.get(key)
+        if entry is None or entry[0] != spec:
+            capacity, period = self._limits(spec)
+            bucket = TokenBucket(capacity, period, now)
+            self._buckets[key] = (spec, bucket)
+        else:
+            bucket = entry[1]
+            tokens = bucket.tokens + (now - bucket.updated_at) * bucket.rate
+            bucket.tokens = tokens if tokens < bucket.capacity else float(bucket.capacity)
+            bucket.updated_at = now
+
+        if bucket.tokens >= cost:
+            bucket.tokens -= cost
+            self.allowed += 1
+            return True, 0.0
+
+        self.rejected += 1
+        return False, (cost - bucket.tokens) / bucket.rate
+
+    def reset(self, key: Any) -> None:
+        self._buckets.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "buckets": len(self._buckets)}
+
+
+@dataclass
+class _Lease:
+    spec: Optional[str]
+    window_start: int
+    window_end: float
+    remaining: int
+    exhausted: bool  # the shared counter has no tokens left for this window
+
+
+class PostgresLeaseBackend(RateLimitBackend):
+    """
+    Limiter shared by all workers through fixed-window counters in Postgres.
+
+    Workers don't hit the database per request: each reserves a chunk of up to
+    `lease_size` tokens with one atomic upsert and serves requests from that
+    local lease until it is used up or the window rolls over. A request costing
+    more than the lease holds reserves the difference. Once the shared
+    counter is exhausted the worker rejects locally until the window ends.
+    Tokens leased but unused by a worker are lost for that window, so the
+    effective limit can be slightly lower than configured, never higher.
+    """
+
+    PRUNE_INTERVAL_SECONDS = 3600
+    EVICT_INTERVAL_SECONDS = 60
+
+    def __init__(
+        self,
+        default_spec: str,
+        lease_size: int,
+        session_factory: Callable[[], AsyncSession] = SessionLocal,
+    ):
+        super().__init__(default_spec)
+        self.lease_size = lease_size
+        self.session_factory = session_factory
+        self._leases: Dict[Any, _Lease] = {}
+        self._locks: Dict[Any, asyncio.Lock] = {}
+        self._last_prune = time.monotonic()
+        self._last_evict = time.monotonic()
+        self.reservations = 0
+        self.errors = 0
+
+    def _current_lease(self, key: Any, spec: Optional[str], now: float) -> Optional[_Lease]:
+        lease = self._leases.get(key)
+        if lease is None or lease.spec != spec or now >= lease.window_end:
+            return None
+        return lease
+
+    def _take(self, key: Any, spec: Optional[str], now: float, cost: int) -> Optional[Tuple[bool, float]]:
+        lease = self._current_lease(key, spec, now)
+        if lease is None:
+            return None
+        if lease.remaining >= cost:
+            lease.remaining -= cost
+            self.allowed += 1
+            return True, 0.0
+        if lease.exhausted:
+            self.rejected += 1
+            return False, lease.window_end - now
+        return None
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop leases whose window has ended, and the locks of keys without a lease."""
+        for key in [key for key, lease in self._leases.items() if now >= lease.window_end]:
+            del self._leases[key]
+        for key in [key for key, lock in self._locks.items() if key not in self._leases and not lock.locked()]:
+            del self._locks[key]
+
+    async def acquire(self, key: Any, spec: Optional[str], cost: int = 1) -> Tuple[bool, float]:
+        now = time.time()
+        if time.monotonic() - self._last_evict > self.EVICT_INTERVAL_SECONDS:
+            self._last_evict = time.monotonic()
+            self._evict_idle(now)
+
+        decision = self._take(key, spec, now, cost)
+        if decision is not None:
+            return decision
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            now = time.time()
+            decision = self._take(key, spec, now, cost)
+            if decision is not None:
+                return decision
+
+            limit, period = self._limits(spec)
+            window_start = int(now // period * period)
+            lease = self._current_lease(key, spec, now)
+            carried = lease.remaining if lease is not None else 0
+            chunk = min(max(self.lease_size, cost - carried), limit)
+            try:
+                granted = await self._reserve(str(key), window_start, int(period), limit, chunk)
+            except Exception:
+                # Fail open: a limiter outage must not take the gateway down.
+                self.errors += 1
+                logger.exception("Rate-limit reservation failed for %s", key)
+                self.allowed += 1
+                return True, 0.0
+
+            lease = _Lease(
+                spec=spec,
+                window_start=window_start,
+                window_end=window_start + period,
+                remaining=carried + granted,
+                exhausted=granted < chunk,
+            )
+            self._leases[key] = lease
+            if lease.remaining >= cost:
+                lease.remaining -= cost
+                self.allowed += 1
+                return True, 0.0
+            # Unused tokens stay in the lease for cheaper requests.
+            self.rejected += 1
+            return False, lease.window_end - now
+
+    async def _reserve(self, bucket_key: str, window_start: int, window_seconds: int, limit: int, chunk: int) -> int:
+        """Atomically reserve up to `chunk` tokens; returns how many were granted."""
+        grant = func.least(chunk, func.greatest(limit - RateLimitCounter.used, 0))
+        stmt = (
+            pg_insert(RateLimitCounter)
+            .values(
+                bucket_key=bucket_key,
+                window_start=window_start,
+                window_seconds=window_seconds,
+                used=chunk,
+                last_grant=chunk,
+            )
+            .on_conflict_do_update(
+                index_elements=[RateLimitCounter.bucket_key, RateLimitCounter.window_start],
+                set_={"last_grant": grant, "used": RateLimitCounter.used + grant},
+            )
+            .returning(RateLimitCounter.last_grant)
+        )
+        async with self.session_factory() as session:
+            granted = (await session.execute(stmt)).scalar_one()
+            if time.monotonic() - self._last_prune > self.PRUNE_INTERVAL_SECONDS:
+                self._last_prune = time.monotonic()
+                # Rows of ended windows are dead, whatever the period of each.
+                await session.execute(
+                    delete(RateLimitCounter).where(
+                        RateLimitCounter.window_start + RateLimitCounter.window_seconds < int(time.time())
+                    )
+                )
+            await session.commit()
+        self.reservations += 1
+        return granted
+
+    def reset(self, key: Any) -> None:
+        self._leases.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "leases": len(self._leases),
+            "lease_size": self.lease_size,
+            "reservations": self.reservations,
+            "errors": self.errors,
+        }
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "postgres":
+        return PostgresLeaseBackend(
+            default_spec=settings.DEFAULT_RATE_LIMIT,
+            lease_size=settings.RATE_LIMIT_LEASE_SIZE,
+        )
+    return TokenBucketLimiter(default_spec=settings.DEFAULT_RATE_LIMIT)
+
+
+rate_limiter = create_rate_limit_backend()
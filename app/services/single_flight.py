@@ -0,0 +1,87 @@
+# app/services/single_flight.py
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+import orjson
+
+T = TypeVar("T")
+
+
+def canonical_json(value: Any) -> Optional[bytes]:
+    """
+    JSON with object keys sorted, so equal arguments give equal bytes whatever
+    their key order. None if the value isn't JSON-serializable.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one.
+
+    The first caller for a key starts the call in its own task; callers that
+    arrive while it runs await the same task and get the same result (or
+    exception). Nothing is cached: once the call finishes, the next caller
+    starts a new one. A caller that is cancelled stops waiting without
+    cancelling the shared call, unless it was the last one waiting: then the
+    call is cancelled too, and the caller returns once it has stopped.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        flight = self._inflight.get(key)
+        if flight is None:
+            self.calls += 1
+            flight = self._inflight[key] = _Flight(asyncio.create_task(call()))
+            flight.task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self._abandon(key, flight)
+                await asyncio.wait((flight.task,))
+
+    def _abandon(self, key: Hashable, flight: _Flight) -> None:
+        # Nobody wants the result any more; later callers start a fresh call.
+        self.abandoned += 1
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        flight.task.cancel()
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        flight = self._inflight.get(key)
+        if flight is not None and flight.task is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller stopped waiting
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "abandoned": self.abandoned,
+            "in_flight": len(self._inflight),
+        }
+
+mcp_single_flight = SingleFlight()
@@ -0,0 +1,149 @@
+# scripts/load_test_db_pool.py
+"""
+Load test: database connections held by the MCP gateway during slow tool calls.
+
+Starts a local MCP server whose `sleep` tool takes --sleep seconds, registers
+it together with a throwaway client in the configured DATABASE_URL (migrated
+Postgres), then fires --calls concurrent /tools/sleep/execute requests at the
+app in-process and samples engine.pool.checkedout() while they run.
+
+A gateway that keeps a connection checked out across the remote call needs one
+connection per in-flight call: with more calls than DB_POOL_SIZE +
+DB_MAX_OVERFLOW they queue for the pool and the wall time grows by --sleep per
+"round". MCP_SESSION_POOL_SIZE defaults to --calls so the MCP session pool
+doesn't queue the calls itself. Run from the repository root, e.g.:
+
+    DB_POOL_SIZE=5 DB_MAX_OVERFLOW=0 python scripts/load_test_db_pool.py --calls 50
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def serve(port: int) -> None:
+    from fastmcp import FastMCP
+
+    mcp = FastMCP("load-test-slow")
+
+    @mcp.tool()
+    async def sleep(seconds: float) -> str:
+        await asyncio.sleep(seconds)
+        return "done"
+
+    asyncio.run(mcp.run_async(transport="sse", host="127.0.0.1", port=port, show_banner=False))
+
+
+async def wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def run(args: argparse.Namespace) -> None:
+    import httpx
+    from sqlalchemy import delete
+
+    from app.core.config import settings
+    from app.db.session import SessionLocal, engine
+    from app.main import app
+    from app.models.client import Client
+    from app.models.mcp_server import MCPServer
+    from app.schemas.client import ClientCreate
+    from app.schemas.mcp_server import MCPServerCreate
+    from app.services.client_services import ClientService
+    from app.services.mcp_server_services import MCPServerService
+
+    tag = f"load-test-{os.getpid()}"
+    async with SessionLocal() as db:
+        client = await ClientService.create_client(db, ClientCreate(client_name=tag, rate_limit="1000000/hour"))
+        server = await MCPServerService.create_server(
+            db, MCPServerCreate(name=tag, server_url=f"http://127.0.0.1:{args.port}/sse", transport_type="sse")
+        )
+        client_uuid, client_id, api_key, server_id = client.id, client.client_id, client.api_key, server.id
+
+    samples = []
+
+    async def sample() -> None:
+        while True:
+            samples.append(engine.pool.checkedout())
+            await asyncio.sleep(0.01)
+
+    url = f"{settings.API_V1_STR}/mcp-clients/{server_id}/tools/sleep/execute"
+    headers = {"X-Client-ID": client_id, "X-API-Key": api_key}
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=None) as http:
+                # Warm up: authenticate the client and open the MCP session.
+                warm = await http.post(url, json={"seconds": 0}, headers=headers)
+                warm.raise_for_status()
+
+                sampler = asyncio.create_task(sample())
+                started = time.perf_counter()
+                responses = await asyncio.gather(
+                    *(http.post(url, json={"seconds": args.sleep}, headers=headers) for _ in range(args.calls))
+                )
+                elapsed = time.perf_counter() - started
+                sampler.cancel()
+    finally:
+        async with SessionLocal() as db:
+            await db.execute(delete(MCPServer).where(MCPServer.id == server_id))
+            await db.execute(delete(Client).where(Client.id == client_uuid))
+            await db.commit()
+
+    print(f"database: {engine.url.render_as_string(hide_password=True)}")
+    print(f"pool: size={settings.DB_POOL_SIZE} max_overflow={settings.DB_MAX_OVERFLOW}")
+    print(f"calls: {args.calls} x {args.sleep}s, concurrently")
+    print(f"status codes: {dict(Counter(response.status_code for response in responses))}")
+    for detail, count in Counter(r.json().get("detail") for r in responses if r.status_code != 200).most_common(3):
+        print(f"  {count} x {detail}")
+    print(f"wall time: {elapsed:.2f}s (ideal {args.sleep:.2f}s)")
+    print(f"checked-out connections: max={max(samples)} mean={sum(samples) / len(samples):.2f}")
+    metrics = getattr(engine.pool, "metrics", None)
+    if metrics is not None:
+        pool = metrics()
+        wait = pool["checkout_wait"]
+        print(f"pool checkouts: {wait['count']}, wait avg={wait['avg_ms']}ms max={wait['max_ms']}ms, "
+              f"timeouts={pool['checkout_timeouts']}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50, help="concurrent tool calls")
+    parser.add_argument("--sleep", type=float, default=1.0, help="seconds each tool call takes")
+    parser.add_argument("--port", type=int, default=8799, help="port of the local MCP server")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port)
+        return
+
+    # Settings are read when the app is imported, in run().
+    os.environ.setdefault("MCP_SESSION_POOL_SIZE", str(args.calls))
+    server = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--serve", "--port", str(args.port)])
+    try:
+        asyncio.run(wait_for_port(args.port))
+        asyncio.run(run(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
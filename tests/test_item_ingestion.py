@@ -0,0 +1,48 @@
+# tests/test_item_ingestion.py
+
+import asyncio
+from typing import List
+
+from app.services.item_ingestion import parse_csv
+
+
+def parse(text: str) -> List:
+    async def lines():
+        for line in text.split("\n"):
+            yield line
+
+    async def collect():
+        return [record async for record in parse_csv(lines())]
+
+    return asyncio.run(collect())
+
+
+def test_literal_quote_in_unquoted_field():
+    text = (
+        "name,description,quantity,item_type\n"
+        'pipe,12" steel pipe,5,TypeA\n'
+        "valve,brass valve,2,TypeB\n"
+        "flange,,1,TypeC"
+    )
+    assert parse(text) == [
+        (2, {"name": "pipe", "description": '12" steel pipe', "quantity": "5", "item_type": "TypeA"}),
+        (3, {"name": "valve", "description": "brass valve", "quantity": "2", "item_type": "TypeB"}),
+        (4, {"name": "flange", "quantity": "1", "item_type": "TypeC"}),
+    ]
+
+
+def test_quoted_field_spans_lines():
+    text = (
+        "name,description,item_type\n"
+        'pipe,"12"" steel,\nthreaded",TypeA\n'
+        "valve,brass valve,TypeB"
+    )
+    assert parse(text) == [
+        (2, {"name": "pipe", "description": '12" steel,\nthreaded', "item_type": "TypeA"}),
+        (4, {"name": "valve", "description": "brass valve", "item_type": "TypeB"}),
+    ]
+
+
+def test_unterminated_quoted_field():
+    text = 'name,item_type\npipe,"TypeA\nvalve,TypeB'
+    assert parse(text) == [(2, "Invalid CSV: unterminated quoted field")]